@@ -1,5 +1,7 @@
 from datetime import datetime
 
+_strptime = datetime.strptime
+
 def datesOverlap(start1, end1, start2, end2):
     return not (end1 < start2 or start1 > end2)
 
@@ -562,6 +564,18 @@ class UsersController:
             return from_types[Applicant]
         return None
 
+_roleMenus = {}
+
+def roleMenu(user):
+    # Menus only depend on the user's class, so build and render them once per role.
+    role = type(user)
+    cached = _roleMenus.get(role)
+    if cached is None:
+        m = tuple(user.menu())
+        menuText = "\n".join(f"{i+1}. {option}" for i, option in enumerate(m))
+        cached = _roleMenus[role] = (m, menuText)
+    return cached
+
 def main():
     usersController = UsersController('ApplicantList.csv', 'OfficerList.csv', 'ManagerList.csv')
     projectsController = ProjectsController('ProjectList.csv')
@@ -579,10 +593,9 @@ def main():
                 print("Invalid NRIC or password")
 
         print(f"Welcome, {currentUser.name} ({UsersController.getUserType(currentUser)})")
+        m, menuText = roleMenu(currentUser)
         while currentUser:
-            m = currentUser.menu()
-            for i, option in enumerate(m):
-                print(f"{i+1}. {option}")
+            print(menuText)
             choice = input("Enter choice: ")
             if not choice.isdigit() or not (1 <= int(choice) <= len(m)):
                 print("Invalid choice")
@@ -677,14 +690,17 @@ def main():
                 cd = input("Close date (yyyy-mm-dd): ")
                 slot = int(input("Officer slots: "))
                 try:
-                    new_od_date = datetime.strptime(od, "%Y-%m-%d")
-                    new_cd_date = datetime.strptime(cd, "%Y-%m-%d")
+                    new_od_date = _strptime(od, "%Y-%m-%d")
+                    new_cd_date = _strptime(cd, "%Y-%m-%d")
                     managerHasOverlap = False
-                    for existing in projectsController.projects:
-                        if existing.manager == currentUser.name:
-                            exist_od = datetime.strptime(existing.openingDate, "%Y-%m-%d")
-                            exist_cd = datetime.strptime(existing.closingDate, "%Y-%m-%d")
-                            if datesOverlap(new_od_date, new_cd_date, exist_od, exist_cd):
+                    _overlap = datesOverlap
+                    _projs = projectsController.projects
+                    _name = currentUser.name
+                    for existing in _projs:
+                        if existing.manager == _name:
+                            exist_od = _strptime(existing.openingDate, "%Y-%m-%d")
+                            exist_cd = _strptime(existing.closingDate, "%Y-%m-%d")
+                            if _overlap(new_od_date, new_cd_date, exist_od, exist_cd):
                                 print("Cannot create project. You already manage a project in the same application period.")
                                 managerHasOverlap = True
                                 break
@@ -729,28 +745,33 @@ def main():
                 new_p2 = None if not new_p2.isdigit() else int(new_p2)
                 new_slots = None if not new_slots.isdigit() else int(new_slots)
 
-                final_od = p.openingDate
-                final_cd = p.closingDate
+                p_open = p.openingDate
+                p_close = p.closingDate
+                final_od = p_open
+                final_cd = p_close
                 try:
                     if new_od.strip():
-                        datetime.strptime(new_od, "%Y-%m-%d")
+                        _strptime(new_od, "%Y-%m-%d")
                         final_od = new_od
                     if new_cd.strip():
-                        datetime.strptime(new_cd, "%Y-%m-%d")
+                        _strptime(new_cd, "%Y-%m-%d")
                         final_cd = new_cd
                 except ValueError:
                     print("Invalid date format. Project not edited.")
                     continue
 
                 try:
-                    od_date_obj = datetime.strptime(final_od, "%Y-%m-%d")
-                    cd_date_obj = datetime.strptime(final_cd, "%Y-%m-%d")
+                    od_date_obj = _strptime(final_od, "%Y-%m-%d")
+                    cd_date_obj = _strptime(final_cd, "%Y-%m-%d")
                     managerHasOverlap = False
-                    for existing in projectsController.projects:
-                        if existing != p and existing.manager == currentUser.name:
-                            exist_od = datetime.strptime(existing.openingDate, "%Y-%m-%d")
-                            exist_cd = datetime.strptime(existing.closingDate, "%Y-%m-%d")
-                            if datesOverlap(od_date_obj, cd_date_obj, exist_od, exist_cd):
+                    _overlap = datesOverlap
+                    _projs = projectsController.projects
+                    _name = currentUser.name
+                    for existing in _projs:
+                        if existing is not p and existing.manager == _name:
+                            exist_od = _strptime(existing.openingDate, "%Y-%m-%d")
+                            exist_cd = _strptime(existing.closingDate, "%Y-%m-%d")
+                            if _overlap(od_date_obj, cd_date_obj, exist_od, exist_cd):
                                 print("Cannot edit project to overlap with an existing project you manage.")
                                 managerHasOverlap = True
                                 break
@@ -1,6 +1,19 @@
+import io
 import os
+import re
 import csv
+import sys
+import atexit
+import weakref
+from bisect import bisect_right, insort
+from collections import OrderedDict
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+from heapq import merge
+from itertools import chain
+from operator import attrgetter, itemgetter
 from datetime import datetime, date
+from enum import IntEnum
 
 APPLICANT_CSV = 'ApplicantList.csv'
 OFFICER_CSV = 'OfficerList.csv'
@@ -13,95 +26,244 @@ ENQUIRY_CSV = 'EnquiryData.csv'
 DATE_FORMAT = "%Y-%m-%d"
 
 
+class MaritalStatus(IntEnum):
+    SINGLE = 0
+    MARRIED = 1
+
+# CSV spelling -> enum; anything else (including wrong case) has no marital code.
+_MARITAL_STATUS_BY_NAME = {"Single": MaritalStatus.SINGLE, "Married": MaritalStatus.MARRIED}
+
+
 class User:
+    __slots__ = ('name', 'nric', '_age', '_marital_status', 'marital_code', 'max_flat_type', 'password')
+    # Fixed per class; hot eligibility paths compare this instead of calling isinstance.
+    role = "user"
+
     def __init__(self, name, nric, age, marital_status, password):
         self.name = name
         self.nric = nric
+        self._marital_status = marital_status
+        self.marital_code = _MARITAL_STATUS_BY_NAME.get(marital_status)
         try:
             self.age = int(age)
         except (ValueError, TypeError):
             self.age = 0
-        self.marital_status = marital_status
         self.password = password
 
+    @property
+    def age(self):
+        return self._age
+
+    @age.setter
+    def age(self, value):
+        self._age = value
+        self._update_max_flat_type()
+
+    @property
+    def marital_status(self):
+        return self._marital_status
+
+    @marital_status.setter
+    def marital_status(self, value):
+        self._marital_status = value
+        self.marital_code = _MARITAL_STATUS_BY_NAME.get(value)
+        self._update_max_flat_type()
+
+    def _update_max_flat_type(self):
+        # Largest flat type the age/marital rules allow (0 = none); kept in step with both fields.
+        code = self.marital_code
+        if code == MaritalStatus.MARRIED and self._age >= 21:
+            self.max_flat_type = 3
+        elif code == MaritalStatus.SINGLE and self._age >= 35:
+            self.max_flat_type = 2
+        else:
+            self.max_flat_type = 0
+
+    @property
+    def can_apply_2_room(self):
+        return self.max_flat_type >= 2
+
+    @property
+    def can_apply_3_room(self):
+        return self.max_flat_type == 3
+
     def get_role(self):
         return "User"
 
 class Applicant(User):
+    __slots__ = ()
+    role = "applicant"
+
     def __init__(self, name, nric, age, marital_status, password):
         super().__init__(name, nric, age, marital_status, password)
     def get_role(self):
         return "Applicant"
 
 class HDBOfficer(Applicant):
+    __slots__ = ()
+    role = "officer"
+
     def __init__(self, name, nric, age, marital_status, password):
         super().__init__(name, nric, age, marital_status, password)
 
     def get_role(self):
         return "HDB Officer"
 class HDBManager(User):
+    __slots__ = ()
+    role = "manager"
+
     def __init__(self, name, nric, age, marital_status, password):
         super().__init__(name, nric, age, marital_status, password)
     
     def get_role(self):
         return "HDB Manager"
+
+# Keyed by exact type: HDBOfficer subclasses Applicant, so isinstance order would matter.
+_ROLE_MAP = {HDBManager: "HDB Manager", HDBOfficer: "HDB Officer", Applicant: "Applicant"}
     
 class Project:
+    __slots__ = ('project_name', '_neighborhood', 'neighborhood_lower', 'type1', '_flat1',
+                 'type2', '_flat2', '_flats', '_opening_date', '_closing_date', '_active_cache',
+                 'manager_nric', 'officer_slot', '_officer_nrics', 'officer_nric_set', 'visibility')
+
     def __init__(self, project_name, neighborhood, type1, num_units1, price1,
                  type2, num_units2, price2, opening_date, closing_date,
                  manager_nric, officer_slot, officer_nrics=None, visibility=True):
         self.project_name = project_name
+        self._active_cache = None
         self.neighborhood = neighborhood
         self.type1 = type1
-        self.num_units1 = int(num_units1)
-        self.price1 = int(price1)
         self.type2 = type2
-        self.num_units2 = int(num_units2)
-        self.price2 = int(price2)
+        # [units, price] per column; _flats maps a room count to the column that offers it,
+        # so flat lookups are a dict hit instead of comparing the type strings.
+        self._flat1 = [int(num_units1), int(price1)]
+        self._flat2 = [int(num_units2), int(price2)]
+        self._flats = {}
+        if type1 == "2-Room":
+            self._flats[2] = self._flat1
+        if type2 == "3-Room":
+            self._flats[3] = self._flat2
         self.opening_date = opening_date
         self.closing_date = closing_date
         self.manager_nric = manager_nric
         self.officer_slot = int(officer_slot)
-        self.officer_nrics = officer_nrics if officer_nrics is not None else []
+        self.officer_nrics = tuple(officer_nrics) if officer_nrics is not None else ()
         self.visibility = visibility
 
     def is_active_period(self, check_date):
         """Checks if the project is within its application period on a given date."""
         return self.opening_date and self.closing_date and (self.opening_date <= check_date <= self.closing_date)
 
-    def is_currently_active(self):
-        """Checks if the project is visible AND within its application period right now."""
-        return self.visibility and self.is_active_period(date.today())
+    def is_currently_active(self, today=None):
+        """Checks if the project is visible AND within its application period today.
+        Callers checking many projects should pass `today` to avoid re-reading the clock."""
+        today = today or date.today()
+        # The period check is stable for a whole day; the cache is dropped whenever the dates change.
+        cached = self._active_cache
+        if cached is None or cached[0] != today:
+            cached = self._active_cache = (today, self.is_active_period(today))
+        return self.visibility and cached[1]
+
+    @property
+    def opening_date(self):
+        return self._opening_date
+
+    @opening_date.setter
+    def opening_date(self, value):
+        self._opening_date = value
+        self._active_cache = None
+
+    @property
+    def closing_date(self):
+        return self._closing_date
+
+    @closing_date.setter
+    def closing_date(self, value):
+        self._closing_date = value
+        self._active_cache = None
+
+    @property
+    def officer_nrics(self):
+        return self._officer_nrics
+
+    @officer_nrics.setter
+    def officer_nrics(self, value):
+        # The ordered tuple is what gets saved; the frozenset mirror serves membership tests.
+        self._officer_nrics = value
+        self.officer_nric_set = frozenset(value)
+
+    @property
+    def neighborhood(self):
+        return self._neighborhood
+
+    @neighborhood.setter
+    def neighborhood(self, value):
+        # The lowercased form is kept alongside so location filters don't re-lower it per comparison.
+        self._neighborhood = value
+        self.neighborhood_lower = value.lower()
+
+    @property
+    def num_units1(self):
+        return self._flat1[0]
+
+    @num_units1.setter
+    def num_units1(self, value):
+        self._flat1[0] = value
+
+    @property
+    def price1(self):
+        return self._flat1[1]
+
+    @price1.setter
+    def price1(self, value):
+        self._flat1[1] = value
+
+    @property
+    def num_units2(self):
+        return self._flat2[0]
+
+    @num_units2.setter
+    def num_units2(self, value):
+        self._flat2[0] = value
+
+    @property
+    def price2(self):
+        return self._flat2[1]
+
+    @price2.setter
+    def price2(self, value):
+        self._flat2[1] = value
 
     def get_flat_details(self, flat_type_room):
         """Returns (num_units, price) for a given flat type (e.g., 2 for 2-Room)."""
-        if flat_type_room == 2 and self.type1 == "2-Room":
-            return self.num_units1, self.price1
-        elif flat_type_room == 3 and self.type2 == "3-Room":
-            return self.num_units2, self.price2
-        return 0, 0
+        flat = self._flats.get(flat_type_room)
+        return (flat[0], flat[1]) if flat else (0, 0)
 
     def decrease_unit_count(self, flat_type_room):
         """Decreases unit count for the booked flat type. Returns True if successful."""
-        if flat_type_room == 2 and self.type1 == "2-Room":
-            if self.num_units1 > 0:
-                self.num_units1 -= 1
-                return True
-        elif flat_type_room == 3 and self.type2 == "3-Room":
-            if self.num_units2 > 0:
-                self.num_units2 -= 1
-                return True
+        flat = self._flats.get(flat_type_room)
+        if flat and flat[0] > 0:
+            flat[0] -= 1
+            return True
         return False
 
     def can_add_officer(self):
         return len(self.officer_nrics) < self.officer_slot
 
+    def add_officer(self, officer_nric):
+        """Appends an officer; goes through the officer_nrics setter so officer_nric_set stays in step."""
+        self.officer_nrics = self.officer_nrics + (officer_nric,)
+
+    def remove_officer(self, officer_nric):
+        self.officer_nrics = tuple(n for n in self.officer_nrics if n != officer_nric)
+
 class Application:
     STATUS_PENDING = "PENDING"
     STATUS_SUCCESSFUL = "SUCCESSFUL"
     STATUS_UNSUCCESSFUL = "UNSUCCESSFUL"
     STATUS_BOOKED = "BOOKED"
-    VALID_STATUSES = [STATUS_PENDING, STATUS_SUCCESSFUL, STATUS_UNSUCCESSFUL, STATUS_BOOKED]
+    VALID_STATUSES = frozenset({STATUS_PENDING, STATUS_SUCCESSFUL, STATUS_UNSUCCESSFUL, STATUS_BOOKED})
+    __slots__ = ('applicant_nric', 'project_name', 'flat_type', 'status', 'request_withdrawal')
 
     def __init__(self, applicant_nric, project_name, flat_type, status=STATUS_PENDING, request_withdrawal=False):
         self.applicant_nric = applicant_nric
@@ -114,14 +276,21 @@ class Registration:
     STATUS_PENDING = "PENDING"
     STATUS_APPROVED = "APPROVED"
     STATUS_REJECTED = "REJECTED"
-    VALID_STATUSES = [STATUS_PENDING, STATUS_APPROVED, STATUS_REJECTED]
+    VALID_STATUSES = frozenset({STATUS_PENDING, STATUS_APPROVED, STATUS_REJECTED})
+    __slots__ = ('officer_nric', 'project_name', 'status')
 
     def __init__(self, officer_nric, project_name, status=STATUS_PENDING):
         self.officer_nric = officer_nric
         self.project_name = project_name
         self.status = status if status in self.VALID_STATUSES else self.STATUS_PENDING
 
+# Statuses a manager can still act on; membership tests keep working if more are added.
+_APPROVABLE_APP_STATUSES = frozenset({Application.STATUS_PENDING})
+_ACTIONABLE_REG_STATUSES = frozenset({Registration.STATUS_PENDING})
+
 class Enquiry:
+    __slots__ = ('enquiry_id', 'applicant_nric', 'project_name', 'text', '_reply', 'replied')
+
     def __init__(self, enquiry_id, applicant_nric, project_name, text, reply=""):
         self.enquiry_id = int(enquiry_id)
         self.applicant_nric = applicant_nric
@@ -129,12 +298,48 @@ class Enquiry:
         self.text = text
         self.reply = reply
 
+    @property
+    def reply(self):
+        return self._reply
+
+    @reply.setter
+    def reply(self, value):
+        # 'replied' is settled here, at reply time, so listing filters read a plain attribute.
+        self._reply = value
+        self.replied = bool(value)
+
     def is_replied(self):
-        return bool(self.reply)
+        return self.replied
+
+class Receipt:
+    # Display labels, in the same order as __slots__.
+    LABELS = ("Applicant Name", "NRIC", "Age", "Marital Status", "Flat Type Booked", "Project Name", "Neighborhood")
+    __slots__ = ('applicant_name', 'nric', 'age', 'marital_status', 'flat_type', 'project_name', 'neighborhood')
+
+    def __init__(self, application, project, applicant):
+        self.applicant_name = applicant.name
+        self.nric = applicant.nric
+        self.age = applicant.age
+        self.marital_status = applicant.marital_status
+        self.flat_type = f"{application.flat_type}-Room"
+        self.project_name = project.project_name
+        self.neighborhood = project.neighborhood
+
+    def items(self):
+        """(label, value) pairs, so a receipt can be shown anywhere a details dict is."""
+        return zip(self.LABELS, (getattr(self, field) for field in self.__slots__))
+
+    def __getitem__(self, label):
+        # Keeps the old dict-style access (receipt["NRIC"]) working for existing callers.
+        return getattr(self, _RECEIPT_FIELD_BY_LABEL[label])
+
+_RECEIPT_FIELD_BY_LABEL = dict(zip(Receipt.LABELS, Receipt.__slots__))
 
 DATE_FORMAT = "%Y-%m-%d"
 
+@lru_cache(maxsize=4096)
 def parse_date(date_str):
+    # Dates are immutable and repeat heavily across rows, so parses are memoized.
     if not date_str:
         return None
     try:
@@ -148,22 +353,41 @@ def format_date(date_obj):
     return date_obj.strftime(DATE_FORMAT)
 
 def dates_overlap(start1, end1, start2, end2):
-    if not all([start1, end1, start2, end2]):
+    if not (start1 and end1 and start2 and end2):
         return False
-    start1, end1 = min(start1, end1), max(start1, end1)
-    start2, end2 = min(start2, end2), max(start2, end2)
+    if start1 > end1:
+        start1, end1 = end1, start1
+    if start2 > end2:
+        start2, end2 = end2, start2
     return not (end1 < start2 or start1 > end2)
 
+def overlapping_projects(projects, start, end):
+    """Bulk form of dates_overlap: yields the projects whose application period overlaps [start, end].
+    The range is normalised once and the comparisons are inlined instead of calling dates_overlap per project."""
+    if not (start and end):
+        return
+    if start > end:
+        start, end = end, start
+    for project in projects:
+        od, cd = project.opening_date, project.closing_date
+        if not (od and cd):
+            continue
+        if od > cd:
+            od, cd = cd, od
+        if od <= end and start <= cd:
+            yield project
+
+def period_start(project):
+    """Sort key for a project's application period: its earlier date, or date.min when it is undated."""
+    od, cd = project.opening_date, project.closing_date
+    if not (od and cd):
+        return date.min
+    return od if od <= cd else cd
+
+_NRIC_RE = re.compile(r'[STst][0-9]{7}[A-Za-z]')
+
 def validate_nric(nric):
-    if not isinstance(nric, str) or len(nric) != 9:
-        return False
-    if nric[0].upper() not in ('S', 'T'):
-        return False
-    if not nric[1:8].isdigit():
-        return False
-    if not nric[8].isalpha():
-        return False
-    return True
+    return isinstance(nric, str) and len(nric) == 9 and _NRIC_RE.fullmatch(nric) is not None
 
 def get_valid_integer_input(prompt, min_val=None, max_val=None):
      while True:
@@ -184,14 +408,18 @@ def get_valid_integer_input(prompt, min_val=None, max_val=None):
          except ValueError:
              print("ERROR: Invalid input. Please enter an integer.")
 
-def get_valid_date_input(prompt):
+def get_valid_date_input(prompt, initial_str=None):
+     """Prompts until a valid date is entered. A non-empty initial_str is tried first, before any prompt."""
+     date_str = initial_str
      while True:
-         date_str = input(f"{prompt} ({DATE_FORMAT}): ").strip()
+         if date_str is None:
+             date_str = input(f"{prompt} ({DATE_FORMAT}): ").strip()
          parsed = parse_date(date_str)
          if parsed:
              return parsed, date_str
          else:
              print(f"ERROR: Invalid date format. Please use {DATE_FORMAT}.")
+             date_str = None
 
 def get_non_empty_input(prompt):
      while True:
@@ -225,12 +453,38 @@ class OperationError(Exception):
     """Custom exception for business logic errors (e.g., ineligible action)."""
     pass
 
+# Validated rows per (path, inode, mtime, ctime, size, headers), so re-opening an unchanged CSV skips parsing it.
+# Rows rather than model instances are cached: instances are mutable and must not be shared between repositories.
+# The stat fields alone can miss a same-size rewrite within one timestamp tick, so this process also drops a
+# path's entries whenever it writes that file (_forget_loaded_rows).
+_LOAD_CACHE = OrderedDict()
+_LOAD_CACHE_SIZE = 16
+
+def _forget_loaded_rows(csv_file):
+    path = os.path.abspath(csv_file)
+    for key in [key for key in _LOAD_CACHE if key[0] == path]:
+        del _LOAD_CACHE[key]
+
+# Repositories with unsaved changes (e.g. an exit inside a batch). Held weakly so a
+# repository that has been dropped is neither kept alive nor flushed over newer files.
+_DIRTY_REPOSITORIES = weakref.WeakSet()
+
+@atexit.register
+def _flush_dirty_repositories():
+    for repo in list(_DIRTY_REPOSITORIES):
+        try:
+            repo.flush()
+        except Exception as e:
+            print(f"Warning: Could not save pending changes to {repo.csv_file} at exit: {e}")
+
 class BaseRepository:
     def __init__(self, csv_file, model_class, required_headers):
         self.csv_file = csv_file
         self.model_class = model_class
         self.required_headers = required_headers
         self.data = {}
+        self._dirty = False
+        self._batch_depth = 0
         self._load_data()
 
     def _ensure_file_exists(self):
@@ -247,140 +501,268 @@ class BaseRepository:
         self._ensure_file_exists()
         self.data = {}
         try:
-            with open(self.csv_file, 'r', newline='') as file:
-                reader = csv.reader(file)
-                header = next(reader, None)
-
-                if not header or not all(h in header for h in self.required_headers):
-                    if not header or not set(self.required_headers).issubset(set(header)):
-                         raise DataLoadError(f"Invalid or missing headers in {self.csv_file}. Expected: {self.required_headers}, Found: {header}")
-
-                header_map = {h: header.index(h) for h in self.required_headers if h in header}
-
-                for i, row in enumerate(reader):
-                    if len(row) < len(self.required_headers):
-                        print(f"Warning: Skipping short row {i+1} in {self.csv_file}: {row}")
-                        continue
-
-                    row_dict = {}
-                    valid_row = True
-                    for req_h, idx in header_map.items():
-                        try:
-                            row_dict[req_h] = row[idx]
-                        except IndexError:
-                            print(f"Warning: Missing expected column '{req_h}' at index {idx} in row {i+1} of {self.csv_file}. Skipping.")
-                            valid_row = False
-                            break
-                    if not valid_row:
-                        continue
+            st = os.stat(self.csv_file)
+            cache_key = (os.path.abspath(self.csv_file), st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size,
+                         tuple(self.required_headers))
+            rows = _LOAD_CACHE.get(cache_key)
+            if rows is None:
+                rows = self._read_rows()
+                _LOAD_CACHE[cache_key] = rows
+                if len(_LOAD_CACHE) > _LOAD_CACHE_SIZE:
+                    _LOAD_CACHE.popitem(last=False)
+            else:
+                _LOAD_CACHE.move_to_end(cache_key)
 
-                    try:
-                        instance = self._create_instance(row_dict)
-                        key = self._get_key(instance)
-                        if key in self.data:
-                             print(f"Warning: Duplicate key '{key}' found in {self.csv_file}. Overwriting with row {i+1}.")
-                        self.data[key] = instance
-                    except (ValueError, TypeError, IndexError) as e:
-                         print(f"Warning: Error processing row {i+1} in {self.csv_file}: {row}. Error: {e}. Skipping.")
-                    except Exception as e:
-                         print(f"Warning: Unexpected error processing row {i+1} in {self.csv_file}: {row}. Error: {e}. Skipping.")
+            for i, row, row_dict in rows:
+                try:
+                    instance = self._create_instance(dict(row_dict))
+                    key = self._get_key(instance)
+                    if key in self.data:
+                         print(f"Warning: Duplicate key '{key}' found in {self.csv_file}. Overwriting with row {i+1}.")
+                    self.data[key] = instance
+                except (ValueError, TypeError, IndexError) as e:
+                     print(f"Warning: Error processing row {i+1} in {self.csv_file}: {row}. Error: {e}. Skipping.")
+                except Exception as e:
+                     print(f"Warning: Unexpected error processing row {i+1} in {self.csv_file}: {row}. Error: {e}. Skipping.")
 
         except FileNotFoundError:
             raise DataLoadError(f"Data file not found during load: {self.csv_file}")
-        except StopIteration:
-            print(f"Info: Data file {self.csv_file} is empty or contains only a header.")
         except IOError as e:
             raise DataLoadError(f"Error reading data file {self.csv_file}: {e}")
         except Exception as e:
             raise DataLoadError(f"Unexpected error loading data from {self.csv_file}: {e}")
         print(f"Loaded {len(self.data)} items from {self.csv_file}.")
 
+    def _read_rows(self):
+        """Parses the CSV into (row number, raw row, column dict) triples, skipping malformed rows."""
+        rows = []
+        with open(self.csv_file, 'r', newline='') as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+
+            # One pass over the header; setdefault keeps the first column on duplicates, as list.index did.
+            header_index = {}
+            for idx, h in enumerate(header or ()):
+                header_index.setdefault(h, idx)
+            if not header:
+                raise DataLoadError(f"Invalid or missing headers in {self.csv_file}. Expected: {self.required_headers}, Found: {header}")
+            missing = [h for h in self.required_headers if h not in header_index]
+            if missing:
+                raise DataLoadError(f"Missing headers in {self.csv_file}: {missing}")
+
+            header_map = {h: header_index[h] for h in self.required_headers if h in header_index}
+            # Cells are picked out in C by a single itemgetter call per row.
+            columns = list(header_map)
+            pick_columns = itemgetter(*header_map.values())
+            last_idx = max(header_map.values())
+
+            for i, row in enumerate(reader):
+                if len(row) < len(self.required_headers):
+                    print(f"Warning: Skipping short row {i+1} in {self.csv_file}: {row}")
+                    continue
+
+                if len(row) <= last_idx:
+                    req_h = next(h for h, idx in header_map.items() if idx >= len(row))
+                    print(f"Warning: Missing expected column '{req_h}' at index {header_map[req_h]} in row {i+1} of {self.csv_file}. Skipping.")
+                    continue
+
+                rows.append((i, row, dict(zip(columns, pick_columns(row)))))
+        return rows
+
 
     def save_data(self):
         """Saves the current state of self.data back to the CSV file."""
         try:
-            with open(self.csv_file, 'w', newline='') as file:
-                writer = csv.writer(file)
-                writer.writerow(self.required_headers)
-                for item in self.data.values():
-                    writer.writerow(self._get_row_data(item))
+            # Serialise in memory, write once to a temp file and swap it in, so a crash
+            # mid-write never leaves a truncated CSV behind.
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            writer.writerow(self.required_headers)
+            writer.writerows(self._get_row_data(item) for item in self.data.values())
+            tmp_file = self.csv_file + '.tmp'
+            with open(tmp_file, 'w', newline='') as file:
+                file.write(buf.getvalue())
+            _forget_loaded_rows(self.csv_file)
+            os.replace(tmp_file, self.csv_file)
         except IOError as e:
             raise DataSaveError(f"Error saving data to {self.csv_file}: {e}")
         except Exception as e:
              raise DataSaveError(f"Unexpected error saving data to {self.csv_file}: {e}")
 
+    def _commit(self):
+        """Marks the repository dirty and writes it out unless a batch is open."""
+        self._dirty = True
+        _DIRTY_REPOSITORIES.add(self)
+        if not self._batch_depth:
+            self.flush()
+
+    def _commit_append(self, item):
+        """Persists a newly added item by appending its row instead of rewriting the file.
+        Falls back to _commit() when a batch is open, other changes are pending, or the file's
+        header is not exactly required_headers (rows are written in required_headers order)."""
+        if self._batch_depth or self._dirty:
+            self._commit()
+            return
+        try:
+            with open(self.csv_file, 'r', newline='') as file:
+                header = next(csv.reader(file), None)
+            if header is not None and header != list(self.required_headers):
+                self._commit()
+                return
+            ends_mid_line = False
+            if header is not None:
+                with open(self.csv_file, 'rb') as file:
+                    file.seek(-1, os.SEEK_END)
+                    ends_mid_line = file.read(1) not in (b'\n', b'\r')
+            _forget_loaded_rows(self.csv_file)
+            with open(self.csv_file, 'a', newline='') as file:
+                writer = csv.writer(file)
+                if header is None:
+                    writer.writerow(self.required_headers)
+                elif ends_mid_line:
+                    writer.writerow([])
+                writer.writerow(self._get_row_data(item))
+        except IOError as e:
+            raise DataSaveError(f"Error appending data to {self.csv_file}: {e}")
+
+    def flush(self):
+        """Writes pending changes to the CSV file, if there are any."""
+        if self._dirty:
+            try:
+                self.save_data()
+            except Exception:
+                # Outside a batch the caller reports the failure and moves on; the changes must
+                # not be written later (e.g. by the exit hook) as if the save had worked.
+                if not self._batch_depth:
+                    self._dirty = False
+                    _DIRTY_REPOSITORIES.discard(self)
+                raise
+            self._dirty = False
+            _DIRTY_REPOSITORIES.discard(self)
+
+    @contextmanager
+    def batch(self):
+        """Defers saving until the outermost batch exits, collapsing N writes into 1."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    @contextmanager
+    def transaction(self):
+        """Like batch(), but if the block raises the pending changes are dropped instead of written.
+        The caller is responsible for undoing its own in-memory edits."""
+        was_dirty = self._dirty
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._dirty = was_dirty
+                if not was_dirty:
+                    _DIRTY_REPOSITORIES.discard(self)
+            raise
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
+
     def get_all(self):
         return list(self.data.values())
 
     def find_by_key(self, key):
         return self.data.get(key)
 
+    def get_many_by_keys(self, keys):
+        """Bulk form of find_by_key: returns {key: item} for the keys that exist."""
+        data = self.data
+        return {key: data[key] for key in keys if key in data}
+
     def add(self, item):
         key = self._get_key(item)
         if key in self.data:
             raise IntegrityError(f"Item with key '{key}' already exists in {self.csv_file}.")
         self.data[key] = item
-        self.save_data()
+        self._commit_append(item)
 
     def update(self, item):
         key = self._get_key(item)
         if key not in self.data:
              raise IntegrityError(f"Item with key '{key}' not found for update in {self.csv_file}.")
         self.data[key] = item
-        self.save_data()
+        self._commit()
 
     def delete(self, key):
         if key not in self.data:
              raise IntegrityError(f"Item with key '{key}' not found for deletion in {self.csv_file}.")
         del self.data[key]
-        self.save_data()
+        self._commit()
+
 
+@contextmanager
+def transaction(*repositories):
+    """Opens a transaction on each repository, so they are all flushed once, together, when the block succeeds."""
+    with ExitStack() as stack:
+        for repository in repositories:
+            stack.enter_context(repository.transaction())
+        yield
+
+
+_SAVE_DISPATCH = {HDBManager: 'manager_repo', HDBOfficer: 'officer_repo', Applicant: 'applicant_repo'}
+
+class UserSubRepository(BaseRepository):
+    """Repository for one user CSV; the model class it builds comes from BaseRepository.model_class."""
+    def _get_key(self, item):
+        return item.nric
+
+    def _create_instance(self, row_dict):
+        if not validate_nric(row_dict['NRIC']):
+            raise ValueError(f"Invalid NRIC format: {row_dict['NRIC']}")
+        return self.model_class(
+            row_dict['Name'], row_dict['NRIC'], row_dict['Age'],
+            row_dict['Marital Status'], row_dict['Password']
+        )
+
+    def _get_row_data(self, item):
+        return [item.name, item.nric, str(item.age), item.marital_status, item.password]
 
 class UserRepository:
     def __init__(self):
-        self.applicant_repo = self._create_sub_repo(APPLICANT_CSV, Applicant, ['Name', 'NRIC', 'Age', 'Marital Status', 'Password'])
-        self.officer_repo = self._create_sub_repo(OFFICER_CSV, HDBOfficer, ['Name', 'NRIC', 'Age', 'Marital Status', 'Password'])
-        self.manager_repo = self._create_sub_repo(MANAGER_CSV, HDBManager, ['Name', 'NRIC', 'Age', 'Marital Status', 'Password'])
-        self._merge_users()
-
-    def _create_sub_repo(self, csv_file, model_class, headers):
-        class SubUserRepository(BaseRepository):
-            def _get_key(self, item):
-                return item.nric
-            def _create_instance(self, row_dict):
-                if not validate_nric(row_dict['NRIC']):
-                    raise ValueError(f"Invalid NRIC format: {row_dict['NRIC']}")
-                return model_class(
-                    row_dict['Name'], row_dict['NRIC'], row_dict['Age'],
-                    row_dict['Marital Status'], row_dict['Password']
-                )
-            def _get_row_data(self, item):
-                return [item.name, item.nric, str(item.age), item.marital_status, item.password]
-        return SubUserRepository(csv_file, model_class, headers)
-
-    def _merge_users(self):
-        self.users = {}
-        self.users.update(self.applicant_repo.data)
-        self.users.update(self.officer_repo.data)
-        self.users.update(self.manager_repo.data)
-        print(f"Total unique users loaded: {len(self.users)}")
+        headers = ['Name', 'NRIC', 'Age', 'Marital Status', 'Password']
+        self.applicant_repo = UserSubRepository(APPLICANT_CSV, Applicant, headers)
+        self.officer_repo = UserSubRepository(OFFICER_CSV, HDBOfficer, headers)
+        self.manager_repo = UserSubRepository(MANAGER_CSV, HDBManager, headers)
 
     def find_user_by_nric(self, nric):
-        return self.users.get(nric.upper())
+        # Looked up straight from the sub-repositories; managers take precedence over
+        # officers over applicants, matching the order the lists used to be merged in.
+        nric = nric.upper()
+        for repo in (self.manager_repo, self.officer_repo, self.applicant_repo):
+            user = repo.data.get(nric)
+            if user is not None:
+                return user
+        return None
+
+    def find_users_by_nrics(self, nrics):
+        """Bulk form of find_user_by_nric: returns {nric: user} for the NRICs that exist."""
+        users = {}
+        for nric in nrics:
+            user = self.find_user_by_nric(nric)
+            if user is not None:
+                users[nric] = user
+        return users
 
     def get_all_users(self):
-        return list(self.users.values())
+        return list(chain(self.applicant_repo.data.values(), self.officer_repo.data.values(), self.manager_repo.data.values()))
 
     def save_user(self, user):
-        if isinstance(user, HDBManager):
-             self.manager_repo.update(user)
-        elif isinstance(user, HDBOfficer):
-             self.officer_repo.update(user)
-        elif isinstance(user, Applicant):
-             self.applicant_repo.update(user)
-        else:
+        repo_name = _SAVE_DISPATCH.get(type(user))
+        if repo_name is None:
              raise TypeError("Unknown user type cannot be saved.")
-        self.users[user.nric] = user
+        getattr(self, repo_name).update(user)
 
 class ProjectRepository(BaseRepository):
     def __init__(self, csv_file=PROJECT_CSV):
@@ -391,6 +773,14 @@ class ProjectRepository(BaseRepository):
             'Application closing date', 'Manager', 'Officer Slot', 'Officer', 'Visibility'
          ]
          self._data_list = []
+         self._by_manager = {}
+         self._manager_of = {}
+         self._by_officer = {}
+         self._officers_of = {}
+         self._by_neighborhood = {}
+         self._neighborhood_of = {}
+         # Bumped on every load and mutation so callers can tell when derived views are stale.
+         self.version = 0
          super().__init__(csv_file, Project, headers)
 
     def _get_key(self, item):
@@ -400,14 +790,15 @@ class ProjectRepository(BaseRepository):
         opening_date = parse_date(row_dict['Application opening date'])
         closing_date = parse_date(row_dict['Application closing date'])
         visibility = row_dict.get('Visibility', 'True').lower() == 'true'
-        officer_nrics = [nric.strip() for nric in row_dict.get('Officer', '').split(',') if nric.strip()]
+        officer_nrics = tuple(nric for nric in map(str.strip, row_dict.get('Officer', '').split(',')) if nric)
 
+        # Project.__init__ already coerces the numeric columns, so they are passed through as read.
         return Project(
             row_dict['Project Name'], row_dict['Neighborhood'],
-            row_dict['Type 1'], int(row_dict['Number of units for Type 1']), int(row_dict['Selling price for Type 1']),
-            row_dict['Type 2'], int(row_dict['Number of units for Type 2']), int(row_dict['Selling price for Type 2']),
+            row_dict['Type 1'], row_dict['Number of units for Type 1'], row_dict['Selling price for Type 1'],
+            row_dict['Type 2'], row_dict['Number of units for Type 2'], row_dict['Selling price for Type 2'],
             opening_date, closing_date,
-            row_dict['Manager'], int(row_dict['Officer Slot']),
+            row_dict['Manager'], row_dict['Officer Slot'],
             officer_nrics, visibility
         )
 
@@ -421,20 +812,130 @@ class ProjectRepository(BaseRepository):
             ','.join(item.officer_nrics), str(item.visibility)
         ]
 
+    def _load_data(self):
+        super()._load_data()
+        self._by_manager = {}
+        self._manager_of = {}
+        self._by_officer = {}
+        self._officers_of = {}
+        self._by_neighborhood = {}
+        self._neighborhood_of = {}
+        for key, project in self.data.items():
+            self._index(key, project)
+        self.version += 1
+
+    def _index(self, key, item):
+        # Each manager's projects are kept ordered by period start so overlap checks can stop early.
+        # The manager, officers and neighborhood can all be changed on the project before update()
+        # is called, so the indexed values are remembered per key to know what to remove later.
+        self._manager_of[key] = item.manager_nric
+        insort(self._by_manager.setdefault(item.manager_nric, []), item, key=period_start)
+        self._officers_of[key] = item.officer_nrics
+        for officer_nric in item.officer_nrics:
+            self._by_officer.setdefault(officer_nric, set()).add(key)
+        self._neighborhood_of[key] = item.neighborhood_lower
+        self._by_neighborhood.setdefault(item.neighborhood_lower, set()).add(key)
+
+    def _unindex(self, key, item):
+        manager_nric = self._manager_of.pop(key, None)
+        if manager_nric is not None:
+            bucket = self._by_manager[manager_nric]
+            bucket.remove(item)
+            if not bucket:
+                del self._by_manager[manager_nric]
+        for officer_nric in self._officers_of.pop(key, ()):
+            names = self._by_officer[officer_nric]
+            names.discard(key)
+            if not names:
+                del self._by_officer[officer_nric]
+        neighborhood = self._neighborhood_of.pop(key, None)
+        if neighborhood is not None:
+            names = self._by_neighborhood[neighborhood]
+            names.discard(key)
+            if not names:
+                del self._by_neighborhood[neighborhood]
+
+    def add(self, item):
+        key = self._get_key(item)
+        if key in self.data:
+            raise IntegrityError(f"Item with key '{key}' already exists in {self.csv_file}.")
+        self.data[key] = item
+        self._index(key, item)
+        self.version += 1
+        self._commit_append(item)
+
+    def update(self, item):
+        key = self._get_key(item)
+        existing_item = self.data.get(key)
+        if existing_item is None:
+             raise IntegrityError(f"Item with key '{key}' not found for update in {self.csv_file}.")
+        self._unindex(key, existing_item)
+        self.data[key] = item
+        self._index(key, item)
+        self.version += 1
+        self._commit()
+
+    def delete(self, key):
+        existing_item = self.data.pop(key, None)
+        if existing_item is None:
+             raise IntegrityError(f"Item with key '{key}' not found for deletion in {self.csv_file}.")
+        self._unindex(key, existing_item)
+        self.version += 1
+        self._commit()
+
+    def rename(self, old_name, item):
+        """Re-keys item from old_name to its current project_name with a single write."""
+        new_name = self._get_key(item)
+        if new_name in self.data:
+            raise IntegrityError(f"Item with key '{new_name}' already exists in {self.csv_file}.")
+        existing_item = self.data.pop(old_name, None)
+        if existing_item is None:
+             raise IntegrityError(f"Item with key '{old_name}' not found for rename in {self.csv_file}.")
+        self._unindex(old_name, existing_item)
+        self.data[new_name] = item
+        self._index(new_name, item)
+        self.version += 1
+        self._commit()
+
     def find_by_name(self, name):
         return self.find_by_key(name)
 
+    def find_by_names(self, names):
+        """Bulk form of find_by_name: returns {name: project} for the names that exist."""
+        return self.get_many_by_keys(names)
+
+    def find_by_manager(self, manager_nric):
+        return list(self._by_manager.get(manager_nric, ()))
+
+    def find_by_manager_starting_by(self, manager_nric, end_date):
+        """Projects of a manager whose application period starts on or before end_date."""
+        bucket = self._by_manager.get(manager_nric, ())
+        return bucket[:bisect_right(bucket, end_date, key=period_start)]
+
+    def find_by_officer(self, officer_nric):
+        return [self.data[name] for name in self._by_officer.get(officer_nric, ())]
+
+    def find_by_neighborhood(self, neighborhood):
+        """Projects in the neighborhood, matched case-insensitively."""
+        return [self.data[name] for name in self._by_neighborhood.get(neighborhood.lower(), ())]
+
     def delete_by_name(self, name):
         self.delete(name)
 
 class ApplicationRepository(BaseRepository):
     def __init__(self, csv_file=APPLICATION_CSV):
          headers = ['ApplicantNRIC', 'ProjectName', 'FlatType', 'Status', 'RequestWithdrawal']
-         self._data_list = []
+         self._by_applicant = {}
+         self._by_project = {}
+         self._active_by_applicant = {}
+         # key -> application, for every application currently BOOKED (the booking report's whole input).
+         self._booked = {}
+         # project name -> {key: application} for applications with a pending withdrawal request.
+         self._withdrawals_by_project = {}
          super().__init__(csv_file, Application, headers)
 
     def _get_key(self, item):
-        return f"{item.applicant_nric}-{item.project_name}"
+        return (item.applicant_nric, item.project_name)
 
     def _create_instance(self, row_dict):
         flat_type = int(row_dict['FlatType'])
@@ -451,8 +952,68 @@ class ApplicationRepository(BaseRepository):
             item.status, str(item.request_withdrawal)
         ]
 
+    def _index(self, item):
+        self._by_applicant.setdefault(item.applicant_nric, []).append(item)
+        self._by_project.setdefault(item.project_name, []).append(item)
+        self._refresh_active(item.applicant_nric)
+        self._refresh_booked(item)
+        self._refresh_withdrawal(item)
+
+    def _unindex(self, item):
+        for index, key in ((self._by_applicant, item.applicant_nric), (self._by_project, item.project_name)):
+            bucket = index[key]
+            bucket.remove(item)
+            if not bucket:
+                del index[key]
+        self._refresh_active(item.applicant_nric)
+        self._booked.pop(self._get_key(item), None)
+        self._drop_withdrawal(item)
+
+    def _refresh_booked(self, item):
+        if item.status == Application.STATUS_BOOKED:
+            self._booked[self._get_key(item)] = item
+        else:
+            self._booked.pop(self._get_key(item), None)
+
+    def _refresh_withdrawal(self, item):
+        if item.request_withdrawal:
+            self._withdrawals_by_project.setdefault(item.project_name, {})[self._get_key(item)] = item
+        else:
+            self._drop_withdrawal(item)
+
+    def _drop_withdrawal(self, item):
+        bucket = self._withdrawals_by_project.get(item.project_name)
+        if bucket is not None:
+            bucket.pop(self._get_key(item), None)
+            if not bucket:
+                del self._withdrawals_by_project[item.project_name]
+
+    def _refresh_active(self, applicant_nric):
+        """Re-points the applicant's entry in _active_by_applicant at their first non-unsuccessful application."""
+        active = next((app for app in self._by_applicant.get(applicant_nric, ()) if app.status != Application.STATUS_UNSUCCESSFUL), None)
+        if active is None:
+            self._active_by_applicant.pop(applicant_nric, None)
+        else:
+            self._active_by_applicant[applicant_nric] = active
+
+    def _store(self, item):
+        """Puts item under its key, replacing (and unindexing) any previous record. Returns the replaced record."""
+        key = self._get_key(item)
+        previous = self.data.get(key)
+        if previous is not None:
+            self._unindex(previous)
+        self.data[key] = item
+        self._index(item)
+        return previous
+
     def _load_data(self):
         self._ensure_file_exists()
+        self.data = {}
+        self._by_applicant = {}
+        self._by_project = {}
+        self._active_by_applicant = {}
+        self._booked = {}
+        self._withdrawals_by_project = {}
         try:
             with open(self.csv_file, 'r', newline='') as file:
                 reader = csv.DictReader(file)
@@ -465,7 +1026,8 @@ class ApplicationRepository(BaseRepository):
                              print(f"Warning: Skipping row {i+1} in {self.csv_file} due to missing columns: {row_dict}")
                              continue
                          instance = self._create_instance(row_dict)
-                         self._data_list.append(instance)
+                         if self._store(instance) is not None:
+                             print(f"Warning: Duplicate key '{self._get_key(instance)}' found in {self.csv_file}. Overwriting with row {i+1}.")
                     except (ValueError, TypeError, KeyError) as e:
                         print(f"Warning: Error processing row {i+1} in {self.csv_file}: {row_dict}. Error: {e}. Skipping.")
                     except Exception as e:
@@ -476,65 +1038,75 @@ class ApplicationRepository(BaseRepository):
             print(f"Info: Data file {self.csv_file} is empty or contains only a header.")
         except Exception as e:
             raise DataLoadError(f"Unexpected error loading data from {self.csv_file}: {e}")
-        print(f"Loaded {len(self._data_list)} items from {self.csv_file}.")
+        print(f"Loaded {len(self.data)} items from {self.csv_file}.")
 
-    def save_data(self):
-        try:
-            with open(self.csv_file, 'w', newline='') as file:
-                writer = csv.writer(file)
-                writer.writerow(self.required_headers)
-                for item in self._data_list:
-                    writer.writerow(self._get_row_data(item))
-        except IOError as e:
-            raise DataSaveError(f"Error saving data to {self.csv_file}: {e}")
-        except Exception as e:
-             raise DataSaveError(f"Unexpected error saving data to {self.csv_file}: {e}")
+    def find_by_applicant_nric(self, nric):
+        return self._active_by_applicant.get(nric)
 
-    def get_all(self):
-        return list(self._data_list)
+    def exists_for_applicant(self, nric):
+        return nric in self._active_by_applicant
 
-    def find_by_applicant_nric(self, nric):
-        for app in self._data_list:
-             if app.applicant_nric == nric and app.status != Application.STATUS_UNSUCCESSFUL:
-                 return app
-        return None
+    def find_by_applicant_and_status(self, nric, status):
+        """First of the applicant's applications with the given status, or None."""
+        return next((app for app in self._by_applicant.get(nric, ()) if app.status == status), None)
 
     def find_by_project_name(self, project_name):
-        return [app for app in self._data_list if app.project_name == project_name]
+        return list(self._by_project.get(project_name, ()))
+
+    def find_booked(self):
+        # The flag is re-checked so a record rolled back after a failed save never leaks through.
+        return [app for app in self._booked.values() if app.status == Application.STATUS_BOOKED]
+
+    def find_withdrawal_requests(self, project_names):
+        """Applications with a pending withdrawal request in any of the named projects."""
+        by_project = self._withdrawals_by_project
+        return [app for name in project_names for app in by_project.get(name, {}).values() if app.request_withdrawal]
+
+    def iter_by_project_names(self, project_names):
+        """Yields the applications of each named project in turn, straight from the project index."""
+        by_project = self._by_project
+        return chain.from_iterable(by_project.get(name, ()) for name in project_names)
 
     def add(self, item):
         existing = self.find_by_applicant_nric(item.applicant_nric)
         if existing:
              raise IntegrityError(f"Applicant {item.applicant_nric} already has an active application for project {existing.project_name}.")
-        self._data_list.append(item)
-        self.save_data()
+        # A re-application supersedes the applicant's unsuccessful record for the same project.
+        if self._store(item) is not None:
+            self._commit()
+        else:
+            self._commit_append(item)
 
     def update(self, item):
-        for i, existing_item in enumerate(self._data_list):
-            if existing_item.applicant_nric == item.applicant_nric and \
-               existing_item.project_name == item.project_name:
-                self._data_list[i] = item
-                self.save_data()
-                return
-        raise IntegrityError(f"Application for {item.applicant_nric} on {item.project_name} not found for update.")
+        existing_item = self.data.get(self._get_key(item))
+        if existing_item is None:
+            raise IntegrityError(f"Application for {item.applicant_nric} on {item.project_name} not found for update.")
+        if existing_item is not item:
+            self._store(item)
+        else:
+            # Status is changed on the record itself before update(), so the derived entries are re-derived.
+            self._refresh_active(item.applicant_nric)
+            self._refresh_booked(item)
+            self._refresh_withdrawal(item)
+        self._commit()
 
     def delete(self, applicant_nric, project_name):
-        original_len = len(self._data_list)
-        self._data_list = [
-            app for app in self._data_list
-            if not (app.applicant_nric == applicant_nric and app.project_name == project_name)
-        ]
-        if len(self._data_list) == original_len:
+        existing_item = self.data.pop((applicant_nric, project_name), None)
+        if existing_item is None:
             raise IntegrityError(f"Application for {applicant_nric} on {project_name} not found for deletion.")
-        self.save_data()
+        self._unindex(existing_item)
+        self._commit()
 class RegistrationRepository(BaseRepository):
     def __init__(self, csv_file=REGISTRATION_CSV):
         headers = ['OfficerNRIC', 'ProjectName', 'Status']
-        self._data_list = []
+        self._by_officer = {}
+        self._by_project = {}
+        # Bumped on every load and mutation so callers can tell when derived views are stale.
+        self.version = 0
         super().__init__(csv_file, Registration, headers)
 
     def _get_key(self, item):
-        return f"{item.officer_nric}-{item.project_name}"
+        return (item.officer_nric, item.project_name)
 
     def _create_instance(self, row_dict):
         return Registration(row_dict['OfficerNRIC'], row_dict['ProjectName'], row_dict['Status'])
@@ -542,9 +1114,32 @@ class RegistrationRepository(BaseRepository):
     def _get_row_data(self, item):
         return [item.officer_nric, item.project_name, item.status]
 
+    def _index(self, item):
+        self._by_officer.setdefault(item.officer_nric, []).append(item)
+        self._by_project.setdefault(item.project_name, []).append(item)
+
+    def _unindex(self, item):
+        for index, key in ((self._by_officer, item.officer_nric), (self._by_project, item.project_name)):
+            bucket = index[key]
+            bucket.remove(item)
+            if not bucket:
+                del index[key]
+
+    def _store(self, item):
+        """Puts item under its key, replacing (and unindexing) any previous record. Returns the replaced record."""
+        key = self._get_key(item)
+        previous = self.data.get(key)
+        if previous is not None:
+            self._unindex(previous)
+        self.data[key] = item
+        self._index(item)
+        return previous
+
     def _load_data(self):
         self._ensure_file_exists()
-        self._data_list = []
+        self.data = {}
+        self._by_officer = {}
+        self._by_project = {}
         try:
             with open(self.csv_file, 'r', newline='') as file:
                 reader = csv.DictReader(file)
@@ -556,7 +1151,8 @@ class RegistrationRepository(BaseRepository):
                              print(f"Warning: Skipping row {i+1} in {self.csv_file} due to missing columns: {row_dict}")
                              continue
                          instance = self._create_instance(row_dict)
-                         self._data_list.append(instance)
+                         if self._store(instance) is not None:
+                             print(f"Warning: Duplicate key '{self._get_key(instance)}' found in {self.csv_file}. Overwriting with row {i+1}.")
                     except (ValueError, TypeError, KeyError) as e:
                         print(f"Warning: Error processing row {i+1} in {self.csv_file}: {row_dict}. Error: {e}. Skipping.")
                     except Exception as e:
@@ -567,74 +1163,89 @@ class RegistrationRepository(BaseRepository):
             print(f"Info: Data file {self.csv_file} is empty or contains only a header.")
         except Exception as e:
             raise DataLoadError(f"Unexpected error loading data from {self.csv_file}: {e}")
-        print(f"Loaded {len(self._data_list)} items from {self.csv_file}.")
-
-    def save_data(self):
-        try:
-            with open(self.csv_file, 'w', newline='') as file:
-                writer = csv.writer(file)
-                writer.writerow(self.required_headers)
-                for item in self._data_list:
-                    writer.writerow(self._get_row_data(item))
-        except IOError as e:
-            raise DataSaveError(f"Error saving data to {self.csv_file}: {e}")
-        except Exception as e:
-             raise DataSaveError(f"Unexpected error saving data to {self.csv_file}: {e}")
-
-    def get_all(self):
-        return list(self._data_list)
+        self.version += 1
+        print(f"Loaded {len(self.data)} items from {self.csv_file}.")
 
     def find_by_officer_and_project(self, officer_nric, project_name):
-        for reg in self._data_list:
-            if reg.officer_nric == officer_nric and reg.project_name == project_name:
-                return reg
-        return None
+        return self.data.get((officer_nric, project_name))
 
     def find_by_officer(self, officer_nric):
-        return [reg for reg in self._data_list if reg.officer_nric == officer_nric]
+        return list(self._by_officer.get(officer_nric, ()))
 
     def find_by_project(self, project_name, status_filter=None):
-        regs = [reg for reg in self._data_list if reg.project_name == project_name]
+        regs = self._by_project.get(project_name, ())
+        if status_filter:
+            return [reg for reg in regs if reg.status == status_filter]
+        return list(regs)
+
+    def find_by_projects(self, project_names, status_filter=None):
+        """find_by_project over several projects at once, concatenated in the order the names are given."""
+        by_project = self._by_project
+        regs = chain.from_iterable(by_project.get(name, ()) for name in project_names)
         if status_filter:
-            regs = [reg for reg in regs if reg.status == status_filter]
-        return regs
+            return [reg for reg in regs if reg.status == status_filter]
+        return list(regs)
 
     def add(self, item):
         if self.find_by_officer_and_project(item.officer_nric, item.project_name):
              raise IntegrityError(f"Registration for {item.officer_nric} on {item.project_name} already exists.")
-        self._data_list.append(item)
-        self.save_data()
+        self._store(item)
+        self.version += 1
+        self._commit_append(item)
 
     def update(self, item):
-        for i, existing_item in enumerate(self._data_list):
-            if existing_item.officer_nric == item.officer_nric and \
-               existing_item.project_name == item.project_name:
-                self._data_list[i] = item
-                self.save_data()
-                return
-        raise IntegrityError(f"Registration for {item.officer_nric} on {item.project_name} not found for update.")
+        existing_item = self.find_by_officer_and_project(item.officer_nric, item.project_name)
+        if existing_item is None:
+            raise IntegrityError(f"Registration for {item.officer_nric} on {item.project_name} not found for update.")
+        if existing_item is not item:
+            self._store(item)
+        self.version += 1
+        self._commit()
 
     def delete(self, officer_nric, project_name):
-        original_len = len(self._data_list)
-        self._data_list = [
-            reg for reg in self._data_list
-            if not (reg.officer_nric == officer_nric and reg.project_name == project_name)
-        ]
-        if len(self._data_list) == original_len:
+        existing_item = self.data.pop((officer_nric, project_name), None)
+        if existing_item is None:
              raise IntegrityError(f"Registration for {officer_nric} on {project_name} not found for deletion.")
-        self.save_data()
+        self._unindex(existing_item)
+        self.version += 1
+        self._commit()
+
 
+_enquiry_id = attrgetter('enquiry_id')
+_project_name = attrgetter('project_name')
 
 class EnquiryRepository(BaseRepository):
     def __init__(self, csv_file=ENQUIRY_CSV):
         headers = ['EnquiryID', 'ApplicantNRIC', 'ProjectName', 'Text', 'Reply']
+        self._by_applicant = {}
+        self._by_project = {}
         super().__init__(csv_file, Enquiry, headers)
         self.next_id = self._calculate_next_id()
 
+    def _load_data(self):
+        super()._load_data()
+        # Everything is kept in enquiry_id order: data is sorted once here, new IDs are always
+        # the largest, and the per-applicant/per-project lists are insorted by ID.
+        self.data = dict(sorted(self.data.items()))
+        self._by_applicant = {}
+        self._by_project = {}
+        for enquiry in self.data.values():
+            self._index(enquiry)
+
+    def _index(self, item):
+        insort(self._by_applicant.setdefault(item.applicant_nric, []), item, key=_enquiry_id)
+        insort(self._by_project.setdefault(item.project_name, []), item, key=_enquiry_id)
+
+    def _unindex(self, item):
+        for index, key in ((self._by_applicant, item.applicant_nric), (self._by_project, item.project_name)):
+            bucket = index[key]
+            bucket.remove(item)
+            if not bucket:
+                del index[key]
+
     def _calculate_next_id(self):
-        if not self.data:
-            return 1
-        return max(int(k) for k in self.data.keys()) + 1
+        # Keys are already ints (see _get_key), so no per-key conversion is needed.
+        return (max(self.data) + 1) if self.data else 1
 
     def _get_key(self, item):
         return item.enquiry_id
@@ -653,8 +1264,29 @@ class EnquiryRepository(BaseRepository):
 
     def add(self, item):
         item.enquiry_id = self.next_id
-        super().add(item)
+        if item.enquiry_id in self.data:
+            raise IntegrityError(f"Item with key '{item.enquiry_id}' already exists in {self.csv_file}.")
+        self.data[item.enquiry_id] = item
+        self._index(item)
         self.next_id += 1
+        self._commit_append(item)
+
+    def update(self, item):
+        existing_item = self.data.get(item.enquiry_id)
+        if existing_item is None:
+             raise IntegrityError(f"Item with key '{item.enquiry_id}' not found for update in {self.csv_file}.")
+        if existing_item is not item:
+            self._unindex(existing_item)
+            self.data[item.enquiry_id] = item
+            self._index(item)
+        self._commit()
+
+    def delete(self, key):
+        existing_item = self.data.pop(key, None)
+        if existing_item is None:
+             raise IntegrityError(f"Item with key '{key}' not found for deletion in {self.csv_file}.")
+        self._unindex(existing_item)
+        self._commit()
 
     def find_by_id(self, enquiry_id):
         try:
@@ -663,10 +1295,16 @@ class EnquiryRepository(BaseRepository):
             return None
 
     def find_by_applicant(self, applicant_nric):
-        return [enq for enq in self.data.values() if enq.applicant_nric == applicant_nric]
+        return list(self._by_applicant.get(applicant_nric, ()))
 
     def find_by_project(self, project_name):
-        return [enq for enq in self.data.values() if enq.project_name == project_name]
+        return list(self._by_project.get(project_name, ()))
+
+    def find_by_projects(self, project_names):
+        """Enquiries of all the named projects, in enquiry ID order."""
+        by_project = self._by_project
+        # Each bucket is kept ID-sorted, so a heap merge yields the combined ID order directly.
+        return list(merge(*(by_project.get(name, ()) for name in project_names), key=_enquiry_id))
 
     def delete_by_id(self, enquiry_id):
         try:
@@ -700,73 +1338,108 @@ class AuthService:
              raise OperationError(f"Failed to save new password: {e}")
 
     def get_user_role(self, user: User):
-        return user.get_role()
+        return _ROLE_MAP.get(type(user)) or user.get_role()
 
 class ProjectService:
     def __init__(self, project_repository: ProjectRepository,
                  registration_repository: RegistrationRepository):
         self.project_repository = project_repository
         self.registration_repository = registration_repository
+        self._sorted_cache = (None, [])
+        # manager NRIC -> (repository version, that manager's projects sorted by name)
+        self._manager_cache = {}
 
 
     def find_project_by_name(self, name):
         return self.project_repository.find_by_name(name)
 
+    def find_projects_by_names(self, names):
+        return self.project_repository.find_by_names(names)
+
     def get_all_projects(self):
-        return sorted(self.project_repository.get_all(), key=lambda p: p.project_name)
+        version, projects = self._sorted_cache
+        if version != self.project_repository.version:
+            projects = sorted(self.project_repository.get_all(), key=_project_name)
+            self._sorted_cache = (self.project_repository.version, projects)
+        return list(projects)
 
     def get_projects_by_manager(self, manager_nric):
-         return sorted(
-             [p for p in self.get_all_projects() if p.manager_nric == manager_nric],
-             key=lambda p: p.project_name
-         )
+         version = self.project_repository.version
+         cached_version, projects = self._manager_cache.get(manager_nric, (None, None))
+         if cached_version != version:
+             projects = sorted(self.project_repository.find_by_manager(manager_nric), key=_project_name)
+             self._manager_cache[manager_nric] = (version, projects)
+         return list(projects)
 
     def get_handled_projects_for_officer(self, officer_nric):
          """Gets projects an officer is approved to handle (via direct assignment)."""
-         handled = []
-         for project in self.get_all_projects():
-             if officer_nric in project.officer_nrics:
-                  handled.append(project)
-         return sorted(handled, key=lambda p: p.project_name)
+         return sorted(self.project_repository.find_by_officer(officer_nric), key=_project_name)
 
     def get_viewable_projects_for_applicant(self, applicant: Applicant, current_application: Application = None):
         """Gets projects viewable by a specific applicant."""
-        viewable = []
-        applicant_applied_project_name = current_application.project_name if current_application else None
-
-        for project in self.get_all_projects():
-            is_project_applied_for = project.project_name == applicant_applied_project_name
+        return self.get_filtered_viewable_projects(applicant, current_application)
 
-            if is_project_applied_for:
-                viewable.append(project)
-                continue
+    def get_filtered_viewable_projects(self, applicant: Applicant, current_application: Application = None,
+                                       location=None, flat_type=None):
+        """Viewable projects for an applicant with filter_projects' criteria applied in the same pass."""
+        applicant_applied_project_name = current_application.project_name if current_application else None
+        today = date.today()
 
-            if not project.is_currently_active():
-                continue
+        flat_type_room = None
+        if flat_type:
+            try:
+                flat_type_room = int(flat_type)
+            except ValueError:
+                print(f"Warning: Invalid flat type filter '{flat_type}'. Ignoring filter.")
+        location = location.lower() if location else None
 
-            can_view_any_flat = False
-            if applicant.marital_status == "Single" and applicant.age >= 35:
-                can_view_any_flat = True
-            elif applicant.marital_status == "Married" and applicant.age >= 21:
-                can_view_any_flat = True
+        if applicant.max_flat_type:
+            candidates = self.get_all_projects()
+        else:
+            # Ineligible applicants only ever see the project they already applied for.
+            applied_project = self.find_project_by_name(applicant_applied_project_name) if applicant_applied_project_name else None
+            candidates = [applied_project] if applied_project else []
 
-            if not can_view_any_flat:
+        # get_all_projects() already yields each project once, in name order.
+        viewable = []
+        for project in candidates:
+            if project.project_name != applicant_applied_project_name:
+                if not project.is_currently_active(today):
+                    continue
+                if project.num_units2 == 0 and project.num_units2 == 0:
+                    continue
+
+            if location and project.neighborhood_lower != location:
                 continue
-
-            if project.num_units1 == 0 and not can_view_any_flat:
+            if flat_type_room == 2 and not (project.type1 == "2-Room" and project.num_units1 > 0):
                 continue
-            if project.num_units2 == 0 and project.num_units2 == 0:
+            if flat_type_room == 3 and not (project.type2 == "3-Room" and project.num_units2 > 0):
                 continue
             viewable.append(project)
+        return viewable
+
+    def list_active(self, today=None):
+        """Gets all currently active projects, reading the clock once for the whole batch."""
+        today = today or date.today()
+        return [p for p in self.get_all_projects() if p.is_currently_active(today)]
 
-        return sorted(list({p.project_name: p for p in viewable}.values()), key=lambda p: p.project_name)
 
+    def get_filtered_projects(self, location=None, flat_type=None):
+        """All projects matching the filters, sorted by name. A location filter is answered from the neighborhood index."""
+        if location:
+            candidates = sorted(self.project_repository.find_by_neighborhood(location), key=_project_name)
+            return self.filter_projects(candidates, flat_type=flat_type)
+        return self.filter_projects(self.get_all_projects(), flat_type=flat_type)
 
     def filter_projects(self, projects, location=None, flat_type=None):
         """Filters a list of projects based on criteria."""
+        if not location and not flat_type:
+            # Nothing to filter: hand a list straight back instead of copying it.
+            return projects if isinstance(projects, list) else list(projects)
         filtered = list(projects)
         if location:
-            filtered = [p for p in filtered if p.neighborhood.lower() == location.lower()]
+            location = location.lower()
+            filtered = [p for p in filtered if p.neighborhood_lower == location]
         if flat_type:
             try:
                 flat_type_room = int(flat_type)
@@ -779,14 +1452,17 @@ class ProjectService:
                 pass
         return filtered
 
-    def check_manager_project_overlap(self, manager_nric, new_opening_date, new_closing_date, project_to_exclude=None):
+    def check_manager_project_overlap(self, manager_nric, new_opening_date, new_closing_date, project_to_exclude=None, today=None):
          """Checks if a manager has another active project overlapping the given dates."""
-         for existing_project in self.get_projects_by_manager(manager_nric):
+         if not (new_opening_date and new_closing_date):
+             return None
+         today = today or date.today()
+         # Only projects starting by the end of the new period can overlap it.
+         candidates = self.project_repository.find_by_manager_starting_by(manager_nric, max(new_opening_date, new_closing_date))
+         for existing_project in overlapping_projects(candidates, new_opening_date, new_closing_date):
              if existing_project == project_to_exclude:
                  continue
-             if existing_project.is_active_period(date.today()) and \
-                dates_overlap(new_opening_date, new_closing_date,
-                              existing_project.opening_date, existing_project.closing_date):
+             if existing_project.is_active_period(today):
                  return existing_project
          return None
 
@@ -796,14 +1472,15 @@ class ProjectService:
             raise OperationError(f"Project name '{name}' already exists.")
         if not (isinstance(od, date) and isinstance(cd, date) and cd >= od):
             raise OperationError("Invalid opening or closing date (must be Date objects, close >= open).")
-        if cd < date.today():
+        today = date.today()
+        if cd < today:
              raise OperationError("Closing date cannot be in the past.")
         if not (0 <= slot <= 10):
              raise OperationError("Officer slots must be between 0 and 10.")
         if any(n < 0 for n in [n1, p1, n2, p2]):
              raise OperationError("Unit counts and prices cannot be negative.")
 
-        conflicting_project = self.check_manager_project_overlap(manager.nric, od, cd)
+        conflicting_project = self.check_manager_project_overlap(manager.nric, od, cd, today=today)
         if conflicting_project:
              raise OperationError(f"Manager already handles an active project ('{conflicting_project.project_name}') during this period.")
 
@@ -826,10 +1503,9 @@ class ProjectService:
         new_name = updates.get('name', project.project_name)
         if new_name != original_name and self.find_project_by_name(new_name):
              raise OperationError(f"Project name '{new_name}' already exists.")
-        project.project_name = new_name
-
-        project.neighborhood = updates.get('neighborhood', project.neighborhood)
 
+        # Everything is validated before the project is touched: name and neighborhood are
+        # repository index keys, and a half-applied edit would leave the indexes pointing wrong.
         n1 = updates.get('n1', project.num_units1)
         p1 = updates.get('p1', project.price1)
         n2 = updates.get('n2', project.num_units2)
@@ -843,31 +1519,32 @@ class ProjectService:
         if slot is not None and slot < len(project.officer_nrics):
             raise OperationError(f"Cannot reduce slots below current number of assigned officers ({len(project.officer_nrics)}).")
 
-        project.num_units1 = n1 if n1 is not None else project.num_units1
-        project.price1 = p1 if p1 is not None else project.price1
-        project.num_units2 = n2 if n2 is not None else project.num_units2
-        project.price2 = p2 if p2 is not None else project.price2
-        project.officer_slot = slot if slot is not None else project.officer_slot
-
         new_od = updates.get('openDate', project.opening_date)
         new_cd = updates.get('closeDate', project.closing_date)
         if not (isinstance(new_od, date) and isinstance(new_cd, date) and new_cd >= new_od):
             raise OperationError("Invalid opening or closing date (must be Date objects, close >= open).")
-        if new_cd < date.today():
+        today = date.today()
+        if new_cd < today:
              raise OperationError("Closing date cannot be set to the past.")
 
         if new_od != project.opening_date or new_cd != project.closing_date:
-            conflicting_project = self.check_manager_project_overlap(manager.nric, new_od, new_cd, project_to_exclude=project)
+            conflicting_project = self.check_manager_project_overlap(manager.nric, new_od, new_cd, project_to_exclude=project, today=today)
             if conflicting_project:
                  raise OperationError(f"Edited dates overlap with another active project ('{conflicting_project.project_name}') you manage.")
 
+        project.project_name = new_name
+        project.neighborhood = updates.get('neighborhood', project.neighborhood)
+        project.num_units1 = n1 if n1 is not None else project.num_units1
+        project.price1 = p1 if p1 is not None else project.price1
+        project.num_units2 = n2 if n2 is not None else project.num_units2
+        project.price2 = p2 if p2 is not None else project.price2
+        project.officer_slot = slot if slot is not None else project.officer_slot
         project.opening_date = new_od
         project.closing_date = new_cd
 
         try:
             if project.project_name != original_name:
-                 self.project_repository.delete_by_name(original_name)
-                 self.project_repository.add(project)
+                 self.project_repository.rename(original_name, project)
             else:
                  self.project_repository.update(project)
         except Exception as e:
@@ -896,14 +1573,15 @@ class ProjectService:
 
     def add_officer_to_project(self, project: Project, officer_nric):
         """Adds an officer NRIC to the project's list if slot available."""
-        if officer_nric not in project.officer_nrics:
+        if officer_nric not in project.officer_nric_set:
             if project.can_add_officer():
-                project.officer_nrics.append(officer_nric)
+                previous = project.officer_nrics
+                project.add_officer(officer_nric)
                 try:
                      self.project_repository.update(project)
                      return True
                 except Exception as e:
-                     project.officer_nrics.remove(officer_nric)
+                     project.officer_nrics = previous
                      print(f"Error saving project after adding officer: {e}")
                      return False
             else:
@@ -913,13 +1591,14 @@ class ProjectService:
 
     def remove_officer_from_project(self, project: Project, officer_nric):
          """Removes an officer NRIC from the project's list."""
-         if officer_nric in project.officer_nrics:
-             project.officer_nrics.remove(officer_nric)
+         if officer_nric in project.officer_nric_set:
+             previous = project.officer_nrics
+             project.remove_officer(officer_nric)
              try:
                  self.project_repository.update(project)
                  return True
              except Exception as e:
-                 project.officer_nrics.append(officer_nric)
+                 project.officer_nrics = previous
                  print(f"Error saving project after removing officer: {e}")
                  return False
          return True
@@ -928,35 +1607,56 @@ class ProjectService:
 class ApplicationService:
     def __init__(self, application_repository: ApplicationRepository,
                  project_service: ProjectService,
-                 registration_service: 'RegistrationService'):
+                 registration_service: 'RegistrationService',
+                 user_repository: UserRepository = None):
         self.application_repository = application_repository
         self.project_service = project_service
         self.registration_service = registration_service
+        self.user_repository = user_repository
 
     def find_application_by_applicant(self, applicant_nric):
         return self.application_repository.find_by_applicant_nric(applicant_nric)
 
+    def exists_for_applicant(self, applicant_nric):
+        return self.application_repository.exists_for_applicant(applicant_nric)
+
+    def find_booked_application_by_applicant(self, applicant_nric):
+        return self.application_repository.find_by_applicant_and_status(applicant_nric, Application.STATUS_BOOKED)
+
     def get_applications_for_project(self, project_name):
         return self.application_repository.find_by_project_name(project_name)
 
+    def get_pending_apps_for_projects(self, project_names):
+        """PENDING applications without a withdrawal request, across the given projects."""
+        return [app for app in self.application_repository.iter_by_project_names(project_names)
+                if app.status in _APPROVABLE_APP_STATUSES and not app.request_withdrawal]
+
+    def get_withdrawal_requests_for_projects(self, project_names):
+        return self.application_repository.find_withdrawal_requests(project_names)
+
     def get_all_applications(self):
         return self.application_repository.get_all()
 
-    def _check_applicant_eligibility(self, applicant: Applicant, project: Project, flat_type: int):
-        """Internal eligibility check for applicant applying."""
-        today = date.today()
-        if not project.is_currently_active():
-             raise OperationError("Project is not currently open for applications.")
+    def list_with_project_and_applicant(self, filter_fn=None, applications=None):
+        """Returns (application, project, applicant) triples, resolving projects and users in one bulk call each.
+        Missing projects or users come back as None."""
+        apps = self.get_all_applications() if applications is None else applications
+        if filter_fn:
+            apps = [app for app in apps if filter_fn(app)]
+        projects = self.project_service.find_projects_by_names({app.project_name for app in apps})
+        users = self.user_repository.find_users_by_nrics({app.applicant_nric for app in apps}) if self.user_repository else {}
+        return [(app, projects.get(app.project_name), users.get(app.applicant_nric)) for app in apps]
 
-        if self.find_application_by_applicant(applicant.nric):
-            raise OperationError("You already have an active BTO application.")
-
-        if applicant.marital_status == "Single":
+    def _check_applicant_eligibility(self, applicant: Applicant, project: Project, flat_type: int):
+        """Internal eligibility check for applicant applying.
+        Pure attribute checks run first; the project clock check and repository lookups come last."""
+        marital_code = applicant.marital_code
+        if marital_code == MaritalStatus.SINGLE:
             if applicant.age < 35:
                 raise OperationError("Single applicants must be at least 35 years old.")
             if flat_type != 2:
                 raise OperationError("Single applicants can only apply for 2-Room flats.")
-        elif applicant.marital_status == "Married":
+        elif marital_code == MaritalStatus.MARRIED:
             if applicant.age < 21:
                 raise OperationError("Married applicants must be at least 21 years old.")
             if flat_type not in [2, 3]:
@@ -964,18 +1664,25 @@ class ApplicationService:
         else:
             raise OperationError("Invalid marital status for application.")
 
+        today = date.today()
+        if not project.is_currently_active(today):
+             raise OperationError("Project is not currently open for applications.")
+
         units, _ = project.get_flat_details(flat_type)
         if units <= 0:
             raise OperationError(f"No {flat_type}-Room units available in this project.")
 
-        if isinstance(applicant, HDBOfficer):
+        if self.find_application_by_applicant(applicant.nric):
+            raise OperationError("You already have an active BTO application.")
+
+        if applicant.role == "officer":
              is_approved_officer = self.registration_service.is_approved_officer_for_project(applicant.nric, project.project_name)
              if is_approved_officer:
                   raise OperationError("You cannot apply for a project you are an approved officer for.")
 
 
     def apply_for_project(self, applicant: Applicant, project: Project, flat_type: int):
-        if isinstance(applicant, HDBManager):
+        if applicant.role == "manager":
             raise OperationError("HDB Managers cannot apply for BTO projects.")
 
         self._check_applicant_eligibility(applicant, project, flat_type)
@@ -1074,7 +1781,7 @@ class ApplicationService:
         if not project:
              raise OperationError("Project associated with application not found.")
         if not self.registration_service.is_approved_officer_for_project(officer.nric, project.project_name):
-             if officer.nric not in project.officer_nrics:
+             if officer.nric not in project.officer_nric_set:
                    raise OperationError("You do not handle the project for this application.")
 
         if application.status != Application.STATUS_SUCCESSFUL:
@@ -1092,49 +1799,60 @@ class ApplicationService:
              raise OperationError(f"Booking failed: No {application.flat_type}-Room units available anymore. Application marked unsuccessful.")
 
         application.status = Application.STATUS_BOOKED
+        project_repository = self.project_service.project_repository
         try:
-            self.project_service.project_repository.update(project)
-            try:
+            # Both records are written together when the block succeeds; nothing is written if it fails.
+            with transaction(project_repository, self.application_repository):
+                project_repository.update(project)
                 self.application_repository.update(application)
-            except Exception as app_save_e:
-                print(f"ERROR: Failed to save application status update after booking: {app_save_e}. Attempting project revert.")
-                project.num_units1 += 1 if application.flat_type == 2 else 0
-                project.num_units2 += 1 if application.flat_type == 3 else 0
-                try:
-                     self.project_service.project_repository.update(project)
-                except Exception as proj_revert_e:
-                     print(f"CRITICAL ERROR: Failed to revert project unit count after application save failure: {proj_revert_e}")
-                raise OperationError(f"Booking partially failed: Unit count updated, but application status save failed: {app_save_e}")
-
-        except Exception as proj_save_e:
+        except Exception as e:
             application.status = original_status
-            print(f"ERROR: Failed to save project unit count update during booking: {proj_save_e}")
-            raise OperationError(f"Booking failed: Could not update project unit count: {proj_save_e}")
+            project.num_units1 += 1 if application.flat_type == 2 else 0
+            project.num_units2 += 1 if application.flat_type == 3 else 0
+            print(f"ERROR: Failed to save booking: {e}. Rolling back.")
+            try:
+                # One of the files may already have been flushed before the failure; write the restored state back.
+                with transaction(project_repository, self.application_repository):
+                    project_repository.update(project)
+                    self.application_repository.update(application)
+            except Exception as revert_e:
+                print(f"CRITICAL ERROR: Failed to save booking rollback: {revert_e}")
+            raise OperationError(f"Booking failed: Could not save the booking: {e}")
 
         return project
 
-    def generate_booking_report_data(self, filter_project_name=None, filter_flat_type_str=None):
-        report_data = []
-        booked_apps = [app for app in self.get_all_applications() if app.status == Application.STATUS_BOOKED]
+    BOOKING_REPORT_HEADERS = ("NRIC", "Flat Type", "Project Name", "Neighborhood")
+
+    def generate_booking_report_data(self, filter_project_name=None, filter_flat_type_str=None, filter_marital=None):
+        """Booking report as one dict per booking, keyed by BOOKING_REPORT_HEADERS."""
+        headers = self.BOOKING_REPORT_HEADERS
+        rows = self.generate_booking_report_rows(filter_project_name, filter_flat_type_str, filter_marital)
+        return [dict(zip(headers, row)) for row in rows]
 
+    def generate_booking_report_rows(self, filter_project_name=None, filter_flat_type_str=None, filter_marital=None):
+        """Booking report as tuples aligned to BOOKING_REPORT_HEADERS, the form ReportView.display_report renders."""
         filter_flat_type = None
         if filter_flat_type_str:
              try: filter_flat_type = int(filter_flat_type_str)
              except ValueError: pass
-
+        marital_code = _MARITAL_STATUS_BY_NAME.get(filter_marital.capitalize()) if filter_marital else None
+
+        # Only booked applications are scanned; the repository keeps them in their own index.
+        booked_apps = [app for app in self.application_repository.find_booked()
+                       if (not filter_project_name or app.project_name == filter_project_name)
+                       and (not filter_flat_type or app.flat_type == filter_flat_type)]
+        if marital_code is not None and self.user_repository:
+            applicants = self.user_repository.find_users_by_nrics({app.applicant_nric for app in booked_apps})
+            booked_apps = [app for app in booked_apps
+                           if app.applicant_nric in applicants and applicants[app.applicant_nric].marital_code == marital_code]
+        # Hash join: the projects of the booked applications are resolved in one bulk lookup.
+        projects_by_name = self.project_service.find_projects_by_names({app.project_name for app in booked_apps})
+        report_data = []
         for app in booked_apps:
-            project = self.project_service.find_project_by_name(app.project_name)
+            project = projects_by_name.get(app.project_name)
             if not project: continue
 
-            if filter_project_name and project.project_name != filter_project_name: continue
-            if filter_flat_type and app.flat_type != filter_flat_type: continue
-
-            report_data.append({
-                "NRIC": app.applicant_nric,
-                "Flat Type": f"{app.flat_type}-Room",
-                "Project Name": project.project_name,
-                "Neighborhood": project.neighborhood
-            })
+            report_data.append((app.applicant_nric, f"{app.flat_type}-Room", project.project_name, project.neighborhood))
         return report_data
 
 
@@ -1145,6 +1863,8 @@ class RegistrationService:
         self.registration_repository = registration_repository
         self.project_service = project_service
         self.application_repository = application_repository
+        self._approval_cache = {}
+        self._approval_cache_version = None
 
     def find_registration(self, officer_nric, project_name):
         return self.registration_repository.find_by_officer_and_project(officer_nric, project_name)
@@ -1155,10 +1875,22 @@ class RegistrationService:
     def get_registrations_for_project(self, project_name, status_filter=None):
         return self.registration_repository.find_by_project(project_name, status_filter)
 
+    def get_registrations_for_projects(self, project_names, status_filter=None):
+        return self.registration_repository.find_by_projects(project_names, status_filter)
+
     def is_approved_officer_for_project(self, officer_nric, project_name):
          """Checks if an officer has an APPROVED registration for a specific project."""
-         reg = self.find_registration(officer_nric, project_name)
-         return reg and reg.status == Registration.STATUS_APPROVED
+         # Answers are memoized per (officer, project) until the registration repository changes.
+         version = self.registration_repository.version
+         if version != self._approval_cache_version:
+             self._approval_cache = {}
+             self._approval_cache_version = version
+         key = (officer_nric, project_name)
+         approved = self._approval_cache.get(key)
+         if approved is None:
+             reg = self.find_registration(officer_nric, project_name)
+             approved = self._approval_cache[key] = bool(reg and reg.status == Registration.STATUS_APPROVED)
+         return approved
 
     def _check_officer_registration_eligibility(self, officer: HDBOfficer, project: Project):
         """Checks if an officer can register for a project."""
@@ -1270,13 +2002,17 @@ class EnquiryService:
         return self.enquiry_repository.find_by_id(enquiry_id)
 
     def get_enquiries_by_applicant(self, applicant_nric):
-        return sorted(self.enquiry_repository.find_by_applicant(applicant_nric), key=lambda e: e.enquiry_id)
+        return self.enquiry_repository.find_by_applicant(applicant_nric)
 
     def get_enquiries_for_project(self, project_name):
-        return sorted(self.enquiry_repository.find_by_project(project_name), key=lambda e: e.enquiry_id)
+        return self.enquiry_repository.find_by_project(project_name)
+
+    def get_enquiries_for_projects(self, project_names):
+        return self.enquiry_repository.find_by_projects(project_names)
 
     def get_all_enquiries(self):
-        return sorted(self.enquiry_repository.get_all(), key=lambda e: e.enquiry_id)
+        # The repository keeps enquiries in ID order, so no sort is needed here.
+        return self.enquiry_repository.get_all()
 
     def submit_enquiry(self, applicant: Applicant, project: Project, text: str):
         if not text or text.isspace():
@@ -1293,7 +2029,7 @@ class EnquiryService:
     def edit_enquiry(self, applicant: Applicant, enquiry: Enquiry, new_text: str):
         if enquiry.applicant_nric != applicant.nric:
             raise OperationError("You can only edit your own enquiries.")
-        if enquiry.is_replied():
+        if enquiry.replied:
             raise OperationError("Cannot edit an enquiry that has already been replied to.")
         if not new_text or new_text.isspace():
             raise OperationError("Enquiry text cannot be empty.")
@@ -1307,7 +2043,7 @@ class EnquiryService:
     def delete_enquiry(self, applicant: Applicant, enquiry: Enquiry):
         if enquiry.applicant_nric != applicant.nric:
             raise OperationError("You can only delete your own enquiries.")
-        if enquiry.is_replied():
+        if enquiry.replied:
             raise OperationError("Cannot delete an enquiry that has already been replied to.")
 
         try:
@@ -1315,6 +2051,23 @@ class EnquiryService:
         except Exception as e:
             raise OperationError(f"Failed to delete enquiry: {e}")
 
+    def _check_manager_reply(self, manager: HDBManager, project: Project):
+        if project.manager_nric != manager.nric:
+             raise OperationError("Managers can only reply to enquiries for projects they manage.")
+
+    def _check_officer_reply(self, officer: HDBOfficer, project: Project):
+        # The assigned-officer set test is cheaper than the registration lookup, so it goes first.
+        if officer.nric in project.officer_nric_set:
+             return
+        if not self.registration_service.is_approved_officer_for_project(officer.nric, project.project_name):
+             raise OperationError("Officers can only reply to enquiries for projects they handle.")
+
+    # Exact user type -> (permission check, prebuilt reply prefix).
+    _REPLY_HANDLERS = {
+        HDBManager: (_check_manager_reply, "[" + sys.intern("Manager") + " - "),
+        HDBOfficer: (_check_officer_reply, "[" + sys.intern("Officer") + " - "),
+    }
+
     def reply_to_enquiry(self, replier_user: User, enquiry: Enquiry, reply_text: str):
         if not reply_text or reply_text.isspace():
             raise OperationError("Reply text cannot be empty.")
@@ -1323,31 +2076,12 @@ class EnquiryService:
         if not project:
              raise OperationError("Project associated with enquiry not found.")
 
-        can_reply = False
-        replier_role = ""
-
-        if isinstance(replier_user, HDBManager):
-            replier_role = "Manager"
-            if project.manager_nric == replier_user.nric:
-                can_reply = True
-            else:
-                 raise OperationError("Managers can only reply to enquiries for projects they manage.")
-        elif isinstance(replier_user, HDBOfficer):
-            replier_role = "Officer"
-            if self.registration_service.is_approved_officer_for_project(replier_user.nric, project.project_name):
-                 can_reply = True
-            elif replier_user.nric in project.officer_nrics:
-                 can_reply = True
-            else:
-                 raise OperationError("Officers can only reply to enquiries for projects they handle.")
-        else:
+        handler, reply_prefix = self._REPLY_HANDLERS.get(type(replier_user), (None, None))
+        if handler is None:
              raise OperationError("Only Managers or Officers can reply to enquiries.")
+        handler(self, replier_user, project)
 
-        if not can_reply:
-             raise OperationError("You do not have permission to reply to this enquiry.")
-
-        replier_name = replier_user.name
-        enquiry.reply = f"[{replier_role} - {replier_name}]: {reply_text}"
+        enquiry.reply = reply_prefix + replier_user.name + "]: " + reply_text
         try:
             self.enquiry_repository.update(enquiry)
         except Exception as e:
@@ -1367,34 +2101,56 @@ class BaseView:
     def get_password(self, prompt="Enter password"):
         return input(f"{prompt}: ").strip()
 
-    def display_menu(self, title, options):
-        print(f"\n--- {title} ---")
+    def _prompt_choice(self, prompt, choices, cancel=True, invalid_message="Invalid selection."):
+        """Prompts until a number that is a key of choices is entered and returns its value.
+        With cancel set, entering 0 returns None."""
+        while True:
+            choice = self.get_input(prompt)
+            if cancel and choice == '0':
+                return None
+            try:
+                selected = choices.get(int(choice))
+            except ValueError:
+                self.display_message("Invalid input. Please enter a number.", error=True)
+                continue
+            if selected is not None:
+                return selected
+            self.display_message(invalid_message, error=True)
+
+    @staticmethod
+    def render_menu(title, options):
+        """Returns the full menu text, so callers with a fixed menu can build it once and reuse it."""
+        lines = [f"\n--- {title} ---"]
+        lines.extend(f"{i + 1}. {option}" for i, option in enumerate(options))
+        lines.append("--------------------")
+        return "\n".join(lines) + "\n"
+
+    def display_menu(self, title, options, rendered=None):
         if not options:
-            print("No options available.")
+            sys.stdout.write(f"\n--- {title} ---\nNo options available.\n")
             return None
-        for i, option in enumerate(options):
-            print(f"{i + 1}. {option}")
-        print("--------------------")
+        # Each view is assembled into one string and written once rather than print()ed line by line.
+        sys.stdout.write(rendered or self.render_menu(title, options))
         choice = get_valid_integer_input("Enter your choice", min_val=1, max_val=len(options))
         return choice
 
     def display_list(self, title, items, empty_message="No items to display."):
-        print(f"\n--- {title} ---")
+        lines = [f"\n--- {title} ---"]
         if not items:
-            print(empty_message)
+            lines.append(empty_message)
         else:
-            for i, item in enumerate(items):
-                print(f"{i + 1}. {item}")
-        print("--------------------")
+            lines.extend(f"{i + 1}. {item}" for i, item in enumerate(items))
+        lines.append("--------------------")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def display_dict(self, title, data_dict):
-        print(f"\n--- {title} ---")
+        lines = [f"\n--- {title} ---"]
         if not data_dict:
-             print("(No details)")
+             lines.append("(No details)")
         else:
-             for key, value in data_dict.items():
-                 print(f"  {key}: {value}")
-        print("-" * (len(title) + 6))
+             lines.extend(f"  {key}: {value}" for key, value in data_dict.items())
+        lines.append("-" * (len(title) + 6))
+        sys.stdout.write("\n".join(lines) + "\n")
 
 class AuthView(BaseView):
     def prompt_login(self):
@@ -1465,27 +2221,19 @@ class ProjectView(BaseView):
             self.display_message("No projects available for selection.", error=True)
             return None
 
-        print("\n--- Select Project ---")
+        # The list is rendered once with one clock read; invalid choices only repeat the prompt.
+        today = date.today()
+        lines = ["\n--- Select Project ---"]
         project_map = {}
         for i, p in enumerate(projects):
             visibility_status = "Visible" if p.visibility else "Hidden"
-            active_status = "Active" if p.is_currently_active() else "Inactive"
-            print(f"{i + 1}. {p.project_name} ({p.neighborhood}) - Status: {active_status}, View: {visibility_status}")
+            active_status = "Active" if p.is_currently_active(today) else "Inactive"
+            lines.append(f"{i + 1}. {p.project_name} ({p.neighborhood}) - Status: {active_status}, View: {visibility_status}")
             project_map[i + 1] = p
-        print("--------------------")
+        lines.append("--------------------")
+        sys.stdout.write("\n".join(lines) + "\n")
 
-        while True:
-             choice = self.get_input("Enter the number of the project (or 0 to cancel)")
-             if choice == '0':
-                 return None
-             try:
-                 index = int(choice)
-                 if index in project_map:
-                     return project_map[index]
-                 else:
-                     self.display_message("Invalid selection.", error=True)
-             except ValueError:
-                 self.display_message("Invalid input. Please enter a number.", error=True)
+        return self._prompt_choice("Enter the number of the project (or 0 to cancel)", project_map)
 
     def prompt_create_project_details(self):
         self.display_message("\n--- Create New Project ---", info=True)
@@ -1509,33 +2257,40 @@ class ProjectView(BaseView):
         updates['name'] = self.get_input(f"New Project Name [{project.project_name}]") or project.project_name
         updates['neighborhood'] = self.get_input(f"New Neighborhood [{project.neighborhood}]") or project.neighborhood
 
-        n1_str = self.get_input(f"New Number of 2-Room units [{project.num_units1}]")
-        updates['n1'] = int(n1_str) if n1_str.isdigit() else project.num_units1
-        p1_str = self.get_input(f"New Selling Price for 2-Room [{project.price1}]")
-        updates['p1'] = int(p1_str) if p1_str.isdigit() else project.price1
-        n2_str = self.get_input(f"New Number of 3-Room units [{project.num_units2}]")
-        updates['n2'] = int(n2_str) if n2_str.isdigit() else project.num_units2
-        p2_str = self.get_input(f"New Selling Price for 3-Room [{project.price2}]")
-        updates['p2'] = int(p2_str) if p2_str.isdigit() else project.price2
-        slot_str = self.get_input(f"New Max Officer Slots [{project.officer_slot}]")
-        updates['officerSlot'] = int(slot_str) if slot_str.isdigit() else project.officer_slot
+        updates['n1'] = self._int_or_default(f"New Number of 2-Room units [{project.num_units1}]", project.num_units1, 0)
+        updates['p1'] = self._int_or_default(f"New Selling Price for 2-Room [{project.price1}]", project.price1, 0)
+        updates['n2'] = self._int_or_default(f"New Number of 3-Room units [{project.num_units2}]", project.num_units2, 0)
+        updates['p2'] = self._int_or_default(f"New Selling Price for 3-Room [{project.price2}]", project.price2, 0)
+        updates['officerSlot'] = self._int_or_default(f"New Max Officer Slots [{project.officer_slot}]", project.officer_slot, 0)
 
+        # The first entry is validated directly; the user is only re-asked if it is not a valid date.
         od_str = self.get_input(f"New Opening Date ({DATE_FORMAT}) [{format_date(project.opening_date)}]")
         if od_str:
-             od, _ = get_valid_date_input(f"Re-enter Opening Date ({DATE_FORMAT})")
+             od, _ = get_valid_date_input("Re-enter Opening Date", od_str)
              updates['openDate'] = od
         else:
              updates['openDate'] = project.opening_date
 
         cd_str = self.get_input(f"New Closing Date ({DATE_FORMAT}) [{format_date(project.closing_date)}]")
         if cd_str:
-             cd, _ = get_valid_date_input(f"Re-enter Closing Date ({DATE_FORMAT})")
+             cd, _ = get_valid_date_input("Re-enter Closing Date", cd_str)
              updates['closeDate'] = cd
         else:
              updates['closeDate'] = project.closing_date
 
         return updates
 
+    def _int_or_default(self, prompt, default, min_val=None):
+        """Reads an optional integer; blank, non-numeric or below-minimum input keeps the default."""
+        value_str = self.get_input(prompt)
+        if not value_str:
+            return default
+        try:
+            value = int(value_str)
+        except ValueError:
+            return default
+        return value if min_val is None or value >= min_val else default
+
 class ApplicationView(BaseView):
     def display_application_status(self, application: Application, project: Project, applicant: Applicant):
          details = {
@@ -1554,41 +2309,26 @@ class ApplicationView(BaseView):
             self.display_message("No applications available for selection.", error=True)
             return None
 
-        print("\n--- Select Application ---")
+        lines = ["\n--- Select Application ---"]
         app_map = {}
+        applicants = user_service.user_repository.find_users_by_nrics({app.applicant_nric for app in applications})
         for i, app in enumerate(applications):
-            applicant = user_service.user_repository.find_user_by_nric(app.applicant_nric)
+            applicant = applicants.get(app.applicant_nric)
             applicant_name = applicant.name if applicant else "Unknown Applicant"
             req_status = " (Withdrawal Requested)" if app.request_withdrawal else ""
-            print(f"{i + 1}. Project: {app.project_name} | Applicant: {applicant_name} ({app.applicant_nric}) | Type: {app.flat_type}-Room | Status: {app.status}{req_status}")
+            lines.append(f"{i + 1}. Project: {app.project_name} | Applicant: {applicant_name} ({app.applicant_nric}) | Type: {app.flat_type}-Room | Status: {app.status}{req_status}")
             app_map[i + 1] = app
-        print("--------------------------")
+        lines.append("--------------------------")
+        sys.stdout.write("\n".join(lines) + "\n")
 
-        while True:
-             choice = self.get_input("Enter the number of the application (or 0 to cancel)")
-             if choice == '0':
-                 return None
-             try:
-                 index = int(choice)
-                 if index in app_map:
-                     return app_map[index]
-                 else:
-                     self.display_message("Invalid selection.", error=True)
-             except ValueError:
-                 self.display_message("Invalid input. Please enter a number.", error=True)
+        return self._prompt_choice("Enter the number of the application (or 0 to cancel)", app_map)
 
     def prompt_flat_type_selection(self, project: Project, applicant: Applicant):
          available_types = []
-         can_apply_2_room = (applicant.marital_status == "Single" and applicant.age >= 35) or \
-                            (applicant.marital_status == "Married" and applicant.age >= 21)
-         can_apply_3_room = (applicant.marital_status == "Married" and applicant.age >= 21)
-
-         units2, _ = project.get_flat_details(2)
-         units3, _ = project.get_flat_details(3)
-
-         if units2 > 0 and can_apply_2_room:
+         max_flat_type = applicant.max_flat_type
+         if max_flat_type >= 2 and project.get_flat_details(2)[0] > 0:
              available_types.append(2)
-         if units3 > 0 and can_apply_3_room:
+         if max_flat_type == 3 and project.get_flat_details(3)[0] > 0:
              available_types.append(3)
 
          if not available_types:
@@ -1600,16 +2340,8 @@ class ApplicationView(BaseView):
               return selected_type
          else:
              options_str = ' or '.join(map(str, available_types))
-             while True:
-                 choice_str = self.get_input(f"Select flat type ({options_str})")
-                 try:
-                     choice = int(choice_str)
-                     if choice in available_types:
-                         return choice
-                     else:
-                          self.display_message(f"Invalid choice. Please enter one of: {options_str}", error=True)
-                 except ValueError:
-                      self.display_message("Invalid input. Please enter a number.", error=True)
+             return self._prompt_choice(f"Select flat type ({options_str})", {t: t for t in available_types},
+                                        cancel=False, invalid_message=f"Invalid choice. Please enter one of: {options_str}")
 
 
 class EnquiryView(BaseView):
@@ -1618,35 +2350,24 @@ class EnquiryView(BaseView):
              "Project": project_name,
              "Submitted by": f"{applicant_name} ({enquiry.applicant_nric})",
              "Enquiry Text": enquiry.text,
-             "Reply": enquiry.reply if enquiry.is_replied() else "(No reply yet)"
+             "Reply": enquiry.reply if enquiry.replied else "(No reply yet)"
          }
          self.display_dict(f"Enquiry ID: {enquiry.enquiry_id}", details)
 
-     def select_enquiry(self, enquiries):
-         if not enquiries:
+     def select_enquiry(self, enquiry_map):
+         """enquiry_map is {enquiry_id: enquiry}, built by the caller while it filters."""
+         if not enquiry_map:
              self.display_message("No enquiries available for selection.", error=True)
              return None
 
-         print("\n--- Select Enquiry (by ID) ---")
-         enquiry_map = {}
-         for enq in enquiries:
-             reply_status = "Replied" if enq.is_replied() else "Unreplied"
-             print(f"  ID: {enq.enquiry_id} | Project: {enq.project_name} | Status: {reply_status} | Text: {enq.text[:50]}...")
-             enquiry_map[enq.enquiry_id] = enq
-         print("-----------------------------")
-
-         while True:
-            id_str = self.get_input("Enter the ID of the enquiry (or 0 to cancel)")
-            if id_str == '0':
-                return None
-            try:
-                enquiry_id = int(id_str)
-                if enquiry_id in enquiry_map:
-                    return enquiry_map[enquiry_id]
-                else:
-                     self.display_message("Invalid enquiry ID.", error=True)
-            except ValueError:
-                 self.display_message("Invalid input. Please enter a number.", error=True)
+         lines = ["\n--- Select Enquiry (by ID) ---"]
+         for enq in enquiry_map.values():
+             reply_status = "Replied" if enq.replied else "Unreplied"
+             lines.append(f"  ID: {enq.enquiry_id} | Project: {enq.project_name} | Status: {reply_status} | Text: {enq.text[:50]}...")
+         lines.append("-----------------------------")
+         sys.stdout.write("\n".join(lines) + "\n")
+
+         return self._prompt_choice("Enter the ID of the enquiry (or 0 to cancel)", enquiry_map, invalid_message="Invalid enquiry ID.")
 
      def prompt_enquiry_text(self, current_text=None):
          prompt = "Enter enquiry text" if current_text is None else f"Enter new enquiry text [{current_text[:30]}...]"
@@ -1670,43 +2391,33 @@ class OfficerView(BaseView):
              self.display_message("No registrations available for selection.", error=True)
              return None
 
-         print("\n--- Select Registration ---")
+         lines = ["\n--- Select Registration ---"]
          reg_map = {}
+         officers = user_service.user_repository.find_users_by_nrics({reg.officer_nric for reg in registrations})
          for i, reg in enumerate(registrations):
-             officer = user_service.user_repository.find_user_by_nric(reg.officer_nric)
+             officer = officers.get(reg.officer_nric)
              officer_name = officer.name if officer else "Unknown Officer"
-             print(f"{i + 1}. Project: {reg.project_name} | Officer: {officer_name} ({reg.officer_nric}) | Status: {reg.status}")
+             lines.append(f"{i + 1}. Project: {reg.project_name} | Officer: {officer_name} ({reg.officer_nric}) | Status: {reg.status}")
              reg_map[i + 1] = reg
-         print("-------------------------")
+         lines.append("-------------------------")
+         sys.stdout.write("\n".join(lines) + "\n")
 
-         while True:
-             choice = self.get_input("Enter the number of the registration (or 0 to cancel)")
-             if choice == '0':
-                 return None
-             try:
-                 index = int(choice)
-                 if index in reg_map:
-                     return reg_map[index]
-                 else:
-                     self.display_message("Invalid selection.", error=True)
-             except ValueError:
-                 self.display_message("Invalid input. Please enter a number.", error=True)
+         return self._prompt_choice("Enter the number of the registration (or 0 to cancel)", reg_map)
 
-    def prompt_applicant_nric_for_booking(self):
+    def _prompt_valid_nric(self, purpose):
         while True:
-             nric = self.get_input("Enter Applicant's NRIC to book flat for")
-             if validate_nric(nric):
+             nric = self.get_input(f"Enter Applicant's NRIC to {purpose}")
+             # get_input always returns a str, so the precompiled pattern can be used directly.
+             if _NRIC_RE.fullmatch(nric):
                  return nric
              else:
                  self.display_message("Invalid NRIC format. Please try again.", error=True)
 
+    def prompt_applicant_nric_for_booking(self):
+        return self._prompt_valid_nric("book flat for")
+
     def prompt_applicant_nric_for_receipt(self):
-         while True:
-             nric = self.get_input("Enter Applicant's NRIC to generate receipt for")
-             if validate_nric(nric):
-                 return nric
-             else:
-                 self.display_message("Invalid NRIC format. Please try again.", error=True)
+        return self._prompt_valid_nric("generate receipt for")
 
     def display_receipt(self, receipt_data):
          self.display_dict("Booking Receipt", receipt_data)
@@ -1715,26 +2426,24 @@ class ManagerView(BaseView):
      pass
 
 class ReportView(BaseView):
-    def display_report(self, title, report_data, headers):
-        print(f"\n--- {title} ---")
-        if not report_data:
-            print("No data found for this report.")
+    def display_report(self, title, report_rows, headers):
+        """report_rows are tuples whose cells line up with headers."""
+        if not report_rows:
+            sys.stdout.write(f"\n--- {title} ---\nNo data found for this report.\n")
             return
 
-        widths = {header: len(header) for header in headers}
-        for row in report_data:
-            for header in headers:
-                 value_str = str(row.get(header, ''))
-                 widths[header] = max(widths[header], len(value_str))
+        # Each cell is stringified once, column by column; widths and rows both reuse those strings.
+        columns = [list(map(str, column)) for column in zip(*report_rows)]
+        widths = [max(len(header), max(map(len, column))) for header, column in zip(headers, columns)]
 
-        header_line = " | ".join(f"{header:<{widths[header]}}" for header in headers)
-        print(header_line)
-        print("-" * len(header_line))
-
-        for row in report_data:
-             row_line = " | ".join(f"{str(row.get(header, '')):<{widths[header]}}" for header in headers)
-             print(row_line)
-        print("-" * len(header_line))
+        # One format template for every line, so the width specs are built once, not per cell.
+        row_fmt = " | ".join(f"{{:<{width}}}" for width in widths)
+        header_line = row_fmt.format(*headers)
+        rule = "-" * len(header_line)
+        lines = [f"\n--- {title} ---", header_line, rule]
+        lines.extend(row_fmt.format(*cells) for cells in zip(*columns))
+        lines.append(rule)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
     def prompt_report_filters(self):
@@ -1748,7 +2457,7 @@ class ReportView(BaseView):
             if not filters[key]:
                 filters[key] = None
 
-        if filters['filter_marital'] and filters['filter_marital'].lower() not in ['single', 'married']:
+        if filters['filter_marital'] and filters['filter_marital'].capitalize() not in _MARITAL_STATUS_BY_NAME:
             self.display_message("Invalid marital status filter. Ignoring.", error=True)
             filters['filter_marital'] = None
         if filters['filter_flat_type_str'] and filters['filter_flat_type_str'] not in ['2', '3']:
@@ -1758,6 +2467,16 @@ class ReportView(BaseView):
         return filters
 
 
+# Views hold no per-instance state, so one shared instance of each serves every controller.
+_BASE_VIEW = BaseView()
+_AUTH_VIEW = AuthView()
+_PROJECT_VIEW = ProjectView()
+_APP_VIEW = ApplicationView()
+_ENQ_VIEW = EnquiryView()
+_OFFICER_VIEW = OfficerView()
+_MANAGER_VIEW = ManagerView()
+_REPORT_VIEW = ReportView()
+
 
 class ApplicationController:
     def __init__(self):
@@ -1770,18 +2489,18 @@ class ApplicationController:
 
              self.project_service = ProjectService(self.project_repo, self.reg_repo)
              self.reg_service = RegistrationService(self.reg_repo, self.project_service, self.app_repo)
-             self.app_service = ApplicationService(self.app_repo, self.project_service, self.reg_service)
+             self.app_service = ApplicationService(self.app_repo, self.project_service, self.reg_service, self.user_repo)
              self.enq_service = EnquiryService(self.enq_repo, self.project_service, self.reg_service, self.user_repo)
              self.auth_service = AuthService(self.user_repo)
 
-             self.base_view = BaseView()
-             self.auth_view = AuthView()
-             self.project_view = ProjectView()
-             self.app_view = ApplicationView()
-             self.enq_view = EnquiryView()
-             self.officer_view = OfficerView()
-             self.manager_view = ManagerView()
-             self.report_view = ReportView()
+             self.base_view = _BASE_VIEW
+             self.auth_view = _AUTH_VIEW
+             self.project_view = _PROJECT_VIEW
+             self.app_view = _APP_VIEW
+             self.enq_view = _ENQ_VIEW
+             self.officer_view = _OFFICER_VIEW
+             self.manager_view = _MANAGER_VIEW
+             self.report_view = _REPORT_VIEW
 
         except (DataLoadError, DataSaveError) as e:
              self.base_view.display_message(f"CRITICAL ERROR during initialization: {e}. Cannot start application.", error=True)
@@ -1792,6 +2511,14 @@ class ApplicationController:
 
         self.current_user = None
         self.user_filters = {}
+        # (nric, repository versions) -> frozenset of project names; a stale key simply misses.
+        self._handled_cache = (None, None)
+        self._managed_cache = (None, None)
+        # Role and its menu are fixed for a session: resolved at login, cleared at logout.
+        self._role = None
+        self._actions = None
+        self._action_names = None
+        self._menu_render = None
 
 
     def run(self):
@@ -1818,8 +2545,8 @@ class ApplicationController:
                 nric, password = self.auth_view.prompt_login()
                 self.current_user = self.auth_service.login(nric, password)
                 self.user_filters = {}
-                role = self.auth_service.get_user_role(self.current_user)
-                self.base_view.display_message(f"Login successful. Welcome, {self.current_user.name} ({role})!", info=True)
+                self._cache_role_menu()
+                self.base_view.display_message(f"Login successful. Welcome, {self.current_user.name} ({self._role})!", info=True)
             except OperationError as e:
                 self.base_view.display_message(str(e), error=True)
                 if not get_yes_no_input("Login failed. Try again?"):
@@ -1831,6 +2558,10 @@ class ApplicationController:
         self.base_view.display_message(f"Logging out user {self.current_user.name}.", info=True)
         self.current_user = None
         self.user_filters = {}
+        self._role = None
+        self._actions = None
+        self._action_names = None
+        self._menu_render = None
 
     def shutdown(self):
         self.base_view.display_message("Exiting BTO Management System. Goodbye!")
@@ -1838,18 +2569,25 @@ class ApplicationController:
 
     def show_main_menu(self):
         """Displays the appropriate menu based on the current user's role."""
-        role = self.auth_service.get_user_role(self.current_user)
-        actions = self._get_available_actions(role)
-        options = list(actions.keys())
+        if self._actions is None:
+            self._cache_role_menu()
+        options = self._action_names
 
-        choice_index = self.base_view.display_menu(f"{role} Menu", options)
+        choice_index = self.base_view.display_menu(f"{self._role} Menu", options, self._menu_render)
         if choice_index is None: return
 
         selected_action_name = options[choice_index - 1]
-        action_method = actions[selected_action_name]
+        action_method = self._actions[selected_action_name]
 
         action_method()
 
+    def _cache_role_menu(self):
+        """Resolves the current user's role and builds its action table once per login."""
+        self._role = self.auth_service.get_user_role(self.current_user)
+        self._actions = self._get_available_actions(self._role)
+        self._action_names = list(self._actions)
+        self._menu_render = BaseView.render_menu(f"{self._role} Menu", self._action_names)
+
     def _get_available_actions(self, role):
         """Returns a dictionary of {action_name: method_to_call} for the role."""
         common_actions = {
@@ -1914,10 +2652,8 @@ class ApplicationController:
 
     def handle_view_projects(self):
          current_app = self.app_service.find_application_by_applicant(self.current_user.nric)
-         projects = self.project_service.get_viewable_projects_for_applicant(self.current_user, current_app)
-
-         filtered_projects = self.project_service.filter_projects(
-             projects, **self.user_filters
+         filtered_projects = self.project_service.get_filtered_viewable_projects(
+             self.current_user, current_app, **self.user_filters
          )
 
          self.base_view.display_message(f"Current Filters: {self.user_filters or 'None'}", info=True)
@@ -1925,7 +2661,7 @@ class ApplicationController:
              self.base_view.display_message("No projects match your criteria or eligibility.")
          else:
              self.base_view.display_message("Displaying projects you are eligible to view/apply for:")
-             is_single = self.current_user.marital_status == "Single"
+             is_single = self.current_user.marital_code == MaritalStatus.SINGLE
              for project in filtered_projects:
                  self.project_view.display_project_details(project, user_role="Applicant", is_single_applicant=is_single)
 
@@ -1934,12 +2670,13 @@ class ApplicationController:
              self.base_view.display_message("Filters updated. View projects again to see changes.", info=True)
 
     def handle_apply_for_project(self):
-        if self.app_service.find_application_by_applicant(self.current_user.nric):
+        if self.app_service.exists_for_applicant(self.current_user.nric):
              raise OperationError("You already have an active application.")
 
         current_app = None
         potential_projects = self.project_service.get_viewable_projects_for_applicant(self.current_user, current_app)
-        selectable_projects = [p for p in potential_projects if p.is_currently_active()]
+        today = date.today()
+        selectable_projects = [p for p in potential_projects if p.is_currently_active(today)]
 
         project_to_apply = self.project_view.select_project(selectable_projects)
         if not project_to_apply: return
@@ -1993,14 +2730,15 @@ class ApplicationController:
             return
 
         self.base_view.display_message("Your Submitted Enquiries:", info=True)
+        projects = self.project_service.find_projects_by_names({enquiry.project_name for enquiry in my_enquiries})
         for enquiry in my_enquiries:
-            project = self.project_service.find_project_by_name(enquiry.project_name)
+            project = projects.get(enquiry.project_name)
             project_name = project.project_name if project else f"Unknown Project ({enquiry.project_name})"
             self.enq_view.display_enquiry(enquiry, project_name, self.current_user.name)
 
     def handle_edit_my_enquiry(self):
         my_enquiries = self.enq_service.get_enquiries_by_applicant(self.current_user.nric)
-        editable_enquiries = [e for e in my_enquiries if not e.is_replied()]
+        editable_enquiries = {e.enquiry_id: e for e in my_enquiries if not e.replied}
 
         enquiry_to_edit = self.enq_view.select_enquiry(editable_enquiries)
         if not enquiry_to_edit: return
@@ -2011,7 +2749,7 @@ class ApplicationController:
 
     def handle_delete_my_enquiry(self):
         my_enquiries = self.enq_service.get_enquiries_by_applicant(self.current_user.nric)
-        deletable_enquiries = [e for e in my_enquiries if not e.is_replied()]
+        deletable_enquiries = {e.enquiry_id: e for e in my_enquiries if not e.replied}
 
         enquiry_to_delete = self.enq_view.select_enquiry(deletable_enquiries)
         if not enquiry_to_delete: return
@@ -2022,16 +2760,14 @@ class ApplicationController:
 
     def handle_register_for_project(self):
         all_projects = self.project_service.get_all_projects()
-        my_regs = {reg.project_name for reg in self.reg_service.get_registrations_by_officer(self.current_user.nric)}
-        my_app = self.app_service.find_application_by_applicant(self.current_user.nric)
-        my_app_project = my_app.project_name if my_app else None
-
-        selectable_projects = [
-            p for p in all_projects
-            if p.project_name not in my_regs and \
-               p.project_name != my_app_project and \
-               p.manager_nric != self.current_user.nric
-        ]
+        cu_nric = self.current_user.nric
+        # Projects already registered for and the project applied to are excluded with one set probe.
+        excluded = {reg.project_name for reg in self.reg_service.get_registrations_by_officer(cu_nric)}
+        my_app = self.app_service.find_application_by_applicant(cu_nric)
+        if my_app:
+            excluded.add(my_app.project_name)
+
+        selectable_projects = [p for p in all_projects if p.project_name not in excluded and p.manager_nric != cu_nric]
 
         project_to_register = self.project_view.select_project(selectable_projects)
         if not project_to_register: return
@@ -2053,12 +2789,15 @@ class ApplicationController:
 
     def _get_officer_handled_project_names(self):
         """Helper to get names of projects officer is approved for or assigned to."""
-        handled_project_names = set()
-        approved_regs = self.reg_service.get_registrations_for_project(None, status_filter=Registration.STATUS_APPROVED)
-        handled_project_names.update(reg.project_name for reg in approved_regs if reg.officer_nric == self.current_user.nric)
-        for p in self.project_service.get_all_projects():
-             if self.current_user.nric in p.officer_nrics:
-                  handled_project_names.add(p.project_name)
+        officer_nric = self.current_user.nric
+        key = (officer_nric, self.project_repo.version)
+        cached_key, cached_names = self._handled_cache
+        if cached_key == key:
+            return cached_names
+        # Answered from the per-officer project index, so no project is scanned. Approving a
+        # registration assigns the officer to the project, which is what puts it in this index.
+        handled_project_names = frozenset(p.project_name for p in self.project_repo.find_by_officer(officer_nric))
+        self._handled_cache = (key, handled_project_names)
         return handled_project_names
 
 
@@ -2071,20 +2810,21 @@ class ApplicationController:
              return
 
         self.base_view.display_message("Projects You Handle:", info=True)
-        sorted_handled = sorted(handled_projects, key=lambda p: p.project_name)
-        is_single = self.current_user.marital_status == "Single"
+        sorted_handled = sorted(handled_projects, key=_project_name)
+        is_single = self.current_user.marital_code == MaritalStatus.SINGLE
         for project in sorted_handled:
              self.project_view.display_project_details(project, user_role="HDB Officer", is_single_applicant=is_single)
 
-    def _get_enquiries_for_actor(self, managed_or_handled_project_names):
+    def _get_enquiries_for_actor(self, managed_or_handled_project_names: frozenset):
         """Helper for Officer/Manager to get relevant enquiries"""
-        relevant_enquiries = []
-        for enquiry in self.enq_service.get_all_enquiries():
-            if enquiry.project_name in managed_or_handled_project_names:
-                 applicant = self.user_repo.find_user_by_nric(enquiry.applicant_nric)
-                 if applicant:
-                    relevant_enquiries.append((enquiry, applicant.name))
-        return relevant_enquiries
+        return self._with_applicant_names(self.enq_service.get_enquiries_for_projects(managed_or_handled_project_names))
+
+    def _with_applicant_names(self, enquiries):
+        """Returns (enquiries, {applicant_nric: name}), resolving all applicants in one bulk lookup.
+        Enquiries whose applicant no longer exists are dropped."""
+        applicants = self.user_repo.find_users_by_nrics({e.applicant_nric for e in enquiries})
+        names = {nric: user.name for nric, user in applicants.items()}
+        return [e for e in enquiries if e.applicant_nric in names], names
 
     def handle_view_reply_enquiries_officer(self):
         handled_project_names = self._get_officer_handled_project_names()
@@ -2092,16 +2832,18 @@ class ApplicationController:
              self.base_view.display_message("You do not handle any projects to view enquiries for.")
              return
 
-        relevant_enquiries_data = self._get_enquiries_for_actor(handled_project_names)
-        if not relevant_enquiries_data:
+        relevant_enquiries, applicant_names = self._get_enquiries_for_actor(handled_project_names)
+        if not relevant_enquiries:
              self.base_view.display_message("No enquiries found for the projects you handle.")
              return
 
-        unreplied_enquiries = [e for e, name in relevant_enquiries_data if not e.is_replied()]
-
         self.base_view.display_message("Enquiries for Projects You Handle:", info=True)
-        for enquiry, applicant_name in relevant_enquiries_data:
-            self.enq_view.display_enquiry(enquiry, enquiry.project_name, applicant_name)
+        # One pass both displays every enquiry and collects the unreplied ones for selection.
+        unreplied_enquiries = {}
+        for enquiry in relevant_enquiries:
+            self.enq_view.display_enquiry(enquiry, enquiry.project_name, applicant_names[enquiry.applicant_nric])
+            if not enquiry.replied:
+                unreplied_enquiries[enquiry.enquiry_id] = enquiry
 
         if not unreplied_enquiries:
              self.base_view.display_message("\nNo unreplied enquiries requiring action.")
@@ -2134,15 +2876,7 @@ class ApplicationController:
 
     def _prepare_receipt_data(self, application, project, applicant):
          """Helper to format data for receipt display/generation."""
-         return {
-            "Applicant Name": applicant.name,
-            "NRIC": applicant.nric,
-            "Age": applicant.age,
-            "Marital Status": applicant.marital_status,
-            "Flat Type Booked": f"{application.flat_type}-Room",
-            "Project Name": project.project_name,
-            "Neighborhood": project.neighborhood
-         }
+         return Receipt(application, project, applicant)
 
     def handle_generate_receipt(self):
          applicant_nric = self.officer_view.prompt_applicant_nric_for_receipt()
@@ -2150,12 +2884,7 @@ class ApplicationController:
          if not applicant:
              raise OperationError(f"Applicant with NRIC {applicant_nric} not found.")
 
-         booked_app = None
-         for app in self.app_repo.get_all():
-              if app.applicant_nric == applicant_nric and app.status == Application.STATUS_BOOKED:
-                   booked_app = app
-                   break
-
+         booked_app = self.app_service.find_booked_application_by_applicant(applicant_nric)
          if not booked_app:
              raise OperationError(f"No booked application found for NRIC {applicant_nric}.")
 
@@ -2208,11 +2937,7 @@ class ApplicationController:
         self.base_view.display_message(f"Project '{project_to_toggle.project_name}' visibility set to {new_status}.", info=True)
 
     def handle_view_all_projects(self):
-         all_projects = self.project_service.get_all_projects()
-
-         filtered_projects = self.project_service.filter_projects(
-             all_projects, **self.user_filters
-         )
+         filtered_projects = self.project_service.get_filtered_projects(**self.user_filters)
 
          self.base_view.display_message(f"Current Filters: {self.user_filters or 'None'}", info=True)
          if not filtered_projects:
@@ -2263,11 +2988,8 @@ class ApplicationController:
     def _select_pending_registration_for_manager(self):
         """Helper for manager to select a PENDING registration from their projects."""
         my_projects = self.project_service.get_projects_by_manager(self.current_user.nric)
-        all_pending_regs = []
-        for project in my_projects:
-            all_pending_regs.extend(
-                self.reg_service.get_registrations_for_project(project.project_name, status_filter=Registration.STATUS_PENDING)
-            )
+        all_pending_regs = [reg for reg in self.reg_service.get_registrations_for_projects([project.project_name for project in my_projects])
+                            if reg.status in _ACTIONABLE_REG_STATUSES]
 
         if not all_pending_regs:
             self.base_view.display_message("No pending officer registrations found for your projects.")
@@ -2308,10 +3030,7 @@ class ApplicationController:
     def _select_pending_application_for_manager(self):
         """Helper for manager to select a PENDING application (no withdrawal req)."""
         my_projects = self.project_service.get_projects_by_manager(self.current_user.nric)
-        all_pending_apps = []
-        for project in my_projects:
-            apps = self.app_service.get_applications_for_project(project.project_name)
-            all_pending_apps.extend([app for app in apps if app.status == Application.STATUS_PENDING and not app.request_withdrawal])
+        all_pending_apps = self.app_service.get_pending_apps_for_projects([project.project_name for project in my_projects])
 
         if not all_pending_apps:
             self.base_view.display_message("No pending applications found for your projects (excluding those with withdrawal requests).")
@@ -2339,10 +3058,7 @@ class ApplicationController:
     def _select_application_with_withdrawal_request_for_manager(self):
         """Helper for manager to select an application with a withdrawal request."""
         my_projects = self.project_service.get_projects_by_manager(self.current_user.nric)
-        apps_with_request = []
-        for project in my_projects:
-            apps = self.app_service.get_applications_for_project(project.project_name)
-            apps_with_request.extend([app for app in apps if app.request_withdrawal])
+        apps_with_request = self.app_service.get_withdrawal_requests_for_projects([project.project_name for project in my_projects])
 
         if not apps_with_request:
             self.base_view.display_message("No applications with pending withdrawal requests found for your projects.")
@@ -2369,29 +3085,30 @@ class ApplicationController:
 
     def handle_generate_booking_report(self):
         filters = self.report_view.prompt_report_filters()
-        report_data = self.app_service.generate_booking_report_data(**filters)
-        headers = ["NRIC", "Flat Type", "Project Name", "Neighborhood"]
-        self.report_view.display_report("Booking Report", report_data, headers)
+        report_rows = self.app_service.generate_booking_report_rows(**filters)
+        self.report_view.display_report("Booking Report", report_rows, ApplicationService.BOOKING_REPORT_HEADERS)
 
 
     def _get_manager_managed_project_names(self):
         """Helper to get names of projects manager manages."""
-        return {p.project_name for p in self.project_service.get_projects_by_manager(self.current_user.nric)}
+        key = (self.current_user.nric, self.project_repo.version)
+        cached_key, cached_names = self._managed_cache
+        if cached_key == key:
+            return cached_names
+        managed_project_names = frozenset(p.project_name for p in self.project_repo.find_by_manager(self.current_user.nric))
+        self._managed_cache = (key, managed_project_names)
+        return managed_project_names
 
     def handle_view_all_enquiries(self):
-        all_enquiries_data = []
-        for enquiry in self.enq_service.get_all_enquiries():
-             applicant = self.user_repo.find_user_by_nric(enquiry.applicant_nric)
-             if applicant:
-                 all_enquiries_data.append((enquiry, applicant.name))
+        all_enquiries, applicant_names = self._with_applicant_names(self.enq_service.get_all_enquiries())
 
-        if not all_enquiries_data:
+        if not all_enquiries:
             self.base_view.display_message("There are no enquiries in the system.")
             return
 
         self.base_view.display_message("All System Enquiries:", info=True)
-        for enquiry, applicant_name in all_enquiries_data:
-            self.enq_view.display_enquiry(enquiry, enquiry.project_name, applicant_name)
+        for enquiry in all_enquiries:
+            self.enq_view.display_enquiry(enquiry, enquiry.project_name, applicant_names[enquiry.applicant_nric])
 
     def handle_view_reply_enquiries_manager(self):
         managed_project_names = self._get_manager_managed_project_names()
@@ -2399,16 +3116,18 @@ class ApplicationController:
              self.base_view.display_message("You do not manage any projects to view enquiries for.")
              return
 
-        relevant_enquiries_data = self._get_enquiries_for_actor(managed_project_names)
-        if not relevant_enquiries_data:
+        relevant_enquiries, applicant_names = self._get_enquiries_for_actor(managed_project_names)
+        if not relevant_enquiries:
              self.base_view.display_message("No enquiries found for the projects you manage.")
              return
 
-        unreplied_enquiries = [e for e, name in relevant_enquiries_data if not e.is_replied()]
-
         self.base_view.display_message("Enquiries for Projects You Manage:", info=True)
-        for enquiry, applicant_name in relevant_enquiries_data:
-            self.enq_view.display_enquiry(enquiry, enquiry.project_name, applicant_name)
+        # One pass both displays every enquiry and collects the unreplied ones for selection.
+        unreplied_enquiries = {}
+        for enquiry in relevant_enquiries:
+            self.enq_view.display_enquiry(enquiry, enquiry.project_name, applicant_names[enquiry.applicant_nric])
+            if not enquiry.replied:
+                unreplied_enquiries[enquiry.enquiry_id] = enquiry
 
         if not unreplied_enquiries:
              self.base_view.display_message("\nNo unreplied enquiries requiring action.")
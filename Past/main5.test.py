@@ -1,4 +1,7 @@
+import os
+import tempfile
 import unittest
+from contextlib import nullcontext
 from datetime import date, timedelta
 
 # import the module that contains the main application code
@@ -30,6 +33,9 @@ class _MemoryUserRepo:
     def find_user_by_nric(self, nric):
         return self.users.get(nric)
 
+    def find_users_by_nrics(self, nrics):
+        return {n: self.users[n] for n in nrics if n in self.users}
+
     def save_user(self, user):
         self.users[user.nric] = user
 
@@ -41,6 +47,7 @@ class _MemoryUserRepo:
 class _MemoryProjectRepo:
     def __init__(self):
         self.projects = {}
+        self.version = 0
 
     def get_all(self):
         return list(self.projects.values())
@@ -48,20 +55,44 @@ class _MemoryProjectRepo:
     def find_by_name(self, name):
         return self.projects.get(name)
 
+    def find_by_names(self, names):
+        return {n: self.projects[n] for n in names if n in self.projects}
+
+    def transaction(self):
+        return nullcontext(self)
+
+    def find_by_manager(self, manager_nric):
+        return [p for p in self.projects.values() if p.manager_nric == manager_nric]
+
+    def find_by_manager_starting_by(self, manager_nric, end_date):
+        return [p for p in self.find_by_manager(manager_nric) if p.opening_date <= end_date]
+
+    def find_by_officer(self, officer_nric):
+        return [p for p in self.projects.values() if officer_nric in p.officer_nrics]
+
     def add(self, project):
         if project.project_name in self.projects:
             raise IntegrityError("duplicate project")
         self.projects[project.project_name] = project
+        self.version += 1
 
     def update(self, project):
         if project.project_name not in self.projects:
             raise IntegrityError("project not found")
         self.projects[project.project_name] = project
+        self.version += 1
 
     def delete_by_name(self, name):
         if name not in self.projects:
             raise IntegrityError("project not found")
         del self.projects[name]
+        self.version += 1
+
+    def rename(self, old_name, project):
+        if project.project_name in self.projects:
+            raise IntegrityError("duplicate project")
+        self.delete_by_name(old_name)
+        self.add(project)
 
 
 class _MemoryApplicationRepo:
@@ -85,6 +116,12 @@ class _MemoryApplicationRepo:
     def find_by_project_name(self, project_name):
         return [a for a in self.apps if a.project_name == project_name]
 
+    def find_booked(self):
+        return [a for a in self.apps if a.status == Application.STATUS_BOOKED]
+
+    def transaction(self):
+        return nullcontext(self)
+
     def add(self, app):
         if self.find_by_applicant_nric(app.applicant_nric):
             raise IntegrityError("duplicate active application for applicant")
@@ -104,6 +141,7 @@ class _MemoryApplicationRepo:
 class _MemoryRegistrationRepo:
     def __init__(self):
         self.regs = []
+        self.version = 0
 
     def _key(self, reg):
         return (reg.officer_nric, reg.project_name)
@@ -131,16 +169,19 @@ class _MemoryRegistrationRepo:
         if self.find_by_officer_and_project(reg.officer_nric, reg.project_name):
             raise IntegrityError("duplicate registration")
         self.regs.append(reg)
+        self.version += 1
 
     def update(self, reg):
         for i, existing in enumerate(self.regs):
             if self._key(existing) == self._key(reg):
                 self.regs[i] = reg
+                self.version += 1
                 return
         raise IntegrityError("registration not found")
 
     def delete(self, officer_nric, project_name):
         self.regs = [r for r in self.regs if self._key(r) != (officer_nric, project_name)]
+        self.version += 1
 
 
 class _MemoryEnquiryRepo:
@@ -190,7 +231,7 @@ def _build_env():
 
     project_service = main5.ProjectService(project_repo, registration_repo)
     registration_service = main5.RegistrationService(registration_repo, project_service, application_repo)
-    application_service = main5.ApplicationService(application_repo, project_service, registration_service)
+    application_service = main5.ApplicationService(application_repo, project_service, registration_service, user_repo)
     enquiry_service = main5.EnquiryService(enquiry_repo, project_service, registration_service, user_repo)
     auth_service = main5.AuthService(user_repo)
 
@@ -692,7 +733,122 @@ class TestBTOSystem(unittest.TestCase):
         data = app_service.generate_booking_report_data(filter_project_name="ReportProj")
         self.assertEqual(len(data), 1)
         self.assertEqual(data[0]["Project Name"], "ReportProj")
-
+        self.assertEqual(len(app_service.generate_booking_report_data(filter_marital="married")), 1)
+        self.assertEqual(app_service.generate_booking_report_data(filter_marital="Single"), [])
+
+
+    # 24. Appending to a CSV whose header differs from the expected one ----
+    def test_24_add_keeps_rows_aligned_with_file_header(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "EnquiryData.csv")
+            with open(path, "w", newline="") as f:
+                f.write("EnquiryID,ApplicantNRIC,ProjectName,Text,Notes,Reply\n")
+                f.write("1,S1234567A,P,old text,note,\n")
+
+            repo = main5.EnquiryRepository(path)
+            repo.add(Enquiry(0, "S7654321B", "Q", "new text"))
+
+            reloaded = main5.EnquiryRepository(path)
+            self.assertEqual(sorted(reloaded.data), [1, 2])
+            self.assertEqual(reloaded.find_by_key(2).text, "new text")
+
+            # A file emptied behind the repository's back gets its header back before the row.
+            open(path, "w").close()
+            reloaded.add(Enquiry(0, "S7654321B", "Q", "third"))
+            self.assertEqual(list(main5.EnquiryRepository(path).data), [3])
+
+    # 25. Re-applying replaces the unsuccessful record for that project ----
+    def test_25_reapplication_replaces_unsuccessful_record(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "ApplicationData.csv")
+            with open(path, "w", newline="") as f:
+                f.write("ApplicantNRIC,ProjectName,FlatType,Status,RequestWithdrawal\n")
+                f.write("S1234567A,P,2,UNSUCCESSFUL,False\n")
+                f.write("S1234567A,Q,2,UNSUCCESSFUL,False\n")
+
+            repo = main5.ApplicationRepository(path)
+            repo.add(Application("S1234567A", "P", 3))
+
+            # Applications are keyed by (applicant, project): the new one takes the old one's place,
+            # while the unsuccessful record for another project is kept.
+            reloaded = main5.ApplicationRepository(path)
+            self.assertEqual(len(reloaded.get_all()), 2)
+            current = reloaded.find_by_key(("S1234567A", "P"))
+            self.assertEqual((current.flat_type, current.status), (3, Application.STATUS_PENDING))
+            self.assertEqual(reloaded.find_by_key(("S1234567A", "Q")).status, Application.STATUS_UNSUCCESSFUL)
+            self.assertIs(reloaded.find_by_applicant_nric("S1234567A"), current)
+
+    # 26. Reloading sees a same-size rewrite even with an unchanged mtime --
+    def test_26_reload_sees_same_size_rewrite(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "EnquiryData.csv")
+            with open(path, "w", newline="") as f:
+                f.write("EnquiryID,ApplicantNRIC,ProjectName,Text,Reply\n1,S1234567A,P,aaaa,\n")
+            self.assertEqual(main5.EnquiryRepository(path).find_by_key(1).text, "aaaa")
+
+            # Rewritten outside the repository, same size, mtime put back as on a coarse-timestamp filesystem.
+            st = os.stat(path)
+            with open(path, "w", newline="") as f:
+                f.write("EnquiryID,ApplicantNRIC,ProjectName,Text,Reply\n1,S1234567A,P,bbbb,\n")
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+            repo = main5.EnquiryRepository(path)
+            self.assertEqual(repo.find_by_key(1).text, "bbbb")
+
+            # Saved by a repository in this process: same size again.
+            enquiry = repo.find_by_key(1)
+            enquiry.text = "cccc"
+            repo.update(enquiry)
+            self.assertEqual(main5.EnquiryRepository(path).find_by_key(1).text, "cccc")
+
+    # 27. A rejected project edit leaves the project and its indexes alone --
+    def test_27_rejected_edit_keeps_neighborhood_index(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "ProjectList.csv")
+            project_repo = main5.ProjectRepository(path)
+            project_service = main5.ProjectService(project_repo, _MemoryRegistrationRepo())
+
+            mgr = HDBManager("Mgr", "S9393939M", 45, "Married", "m")
+            prj = _create_project("EditProj", mgr, project_repo)
+
+            with self.assertRaises(OperationError):
+                project_service.edit_project(mgr, prj, {"name": "Renamed", "neighborhood": "Elsewhere", "officerSlot": 11})
+
+            self.assertEqual((prj.project_name, prj.neighborhood), ("EditProj", "TestVille"))
+            self.assertEqual(project_service.get_filtered_projects(location="TestVille"), [prj])
+            self.assertEqual(project_service.get_filtered_projects(location="Elsewhere"), [])
+
+    # 28. Reassigning a project's manager moves it between manager indexes --
+    def test_28_update_after_manager_reassignment(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            project_repo = main5.ProjectRepository(os.path.join(tmp, "ProjectList.csv"))
+            old_mgr = HDBManager("Old", "S9292929M", 45, "Married", "m")
+            prj = _create_project("HandoverProj", old_mgr, project_repo)
+
+            prj.manager_nric = "T2222222B"
+            project_repo.update(prj)
+
+            self.assertEqual(project_repo.find_by_manager(old_mgr.nric), [])
+            self.assertEqual(project_repo.find_by_manager("T2222222B"), [prj])
+
+    # 29. A failed save is not retried later, e.g. by the exit hook ---------
+    def test_29_failed_save_is_not_left_pending(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "EnquiryData.csv")
+            with open(path, "w", newline="") as f:
+                f.write("EnquiryID,ApplicantNRIC,ProjectName,Text,Reply\n1,S1234567A,P,text,\n")
+            repo = main5.EnquiryRepository(path)
+
+            def failing_save():
+                raise main5.DataSaveError("disk full")
+            repo.save_data = failing_save
+
+            enquiry = repo.find_by_key(1)
+            enquiry.reply = "answer"
+            with self.assertRaises(main5.DataSaveError):
+                repo.update(enquiry)
+            self.assertNotIn(repo, main5._DIRTY_REPOSITORIES)
+            main5._flush_dirty_repositories()
+            self.assertEqual(main5.EnquiryRepository(path).find_by_key(1).reply, "")
 
 # ---------------------------------------------------------------------------
 # Main execution point ------------------------------------------------------
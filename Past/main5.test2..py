@@ -1,12 +1,15 @@
 import unittest
+import io
 import os
 import csv
 import shutil
 import traceback # Import traceback for detailed error printing
 from datetime import date, timedelta
 
+import main5
+
 # Assuming main5.py is in the same directory
-from Past.main6 import (
+from main5 import (
     ApplicationController, User, Applicant, HDBOfficer, HDBManager, Project,
     Application, Registration, Enquiry, OperationError, IntegrityError,
     DataLoadError, DataSaveError,
@@ -86,6 +89,14 @@ def write_csv(filename, headers, data):
         print(f"ERROR writing CSV {filename}: {e}")
         raise # Re-raise to indicate failure
 
+def render_csv(headers, data):
+    """Returns the exact text write_csv would produce, so it can be rendered once and written many times."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(headers)
+    writer.writerows(data)
+    return buffer.getvalue()
+
 def read_csv(filename):
     data = []
     headers = None # Initialize headers
@@ -102,78 +113,135 @@ def read_csv(filename):
             # Decide if this should be fatal for the test helper
     return headers, data
 
+# Every data file with its headers and the sample rows each test starts from.
+SAMPLE_CSVS = [
+    (APPLICANT_CSV, ['Name', 'NRIC', 'Age', 'Marital Status', 'Password'], SAMPLE_APPLICANTS),
+    (OFFICER_CSV, ['Name', 'NRIC', 'Age', 'Marital Status', 'Password'], SAMPLE_OFFICERS),
+    (MANAGER_CSV, ['Name', 'NRIC', 'Age', 'Marital Status', 'Password'], SAMPLE_MANAGERS),
+    (PROJECT_CSV, [
+        'Project Name', 'Neighborhood', 'Type 1', 'Number of units for Type 1',
+        'Selling price for Type 1', 'Type 2', 'Number of units for Type 2',
+        'Selling price for Type 2', 'Application opening date',
+        'Application closing date', 'Manager', 'Officer Slot', 'Officer', 'Visibility'
+    ], SAMPLE_PROJECTS),
+    (APPLICATION_CSV, ['ApplicantNRIC', 'ProjectName', 'FlatType', 'Status', 'RequestWithdrawal'], SAMPLE_APPLICATIONS),
+    (REGISTRATION_CSV, ['OfficerNRIC', 'ProjectName', 'Status'], SAMPLE_REGISTRATIONS),
+    (ENQUIRY_CSV, ['EnquiryID', 'ApplicantNRIC', 'ProjectName', 'Text', 'Reply'], SAMPLE_ENQUIRIES),
+]
+
 
 # --- Test Class ---
 class TestBTOMain(unittest.TestCase):
 
-    # Keep setUpClass as before
     @classmethod
     def setUpClass(cls):
-        if not os.path.exists(TEST_DATA_DIR):
-            os.makedirs(TEST_DATA_DIR)
-
-    def setUp(self):
-        """Back up original files and set up clean test files."""
-        print(f"\n--- Running setUp for test: {self.id()} ---") # Identify which test is running setup
-        # **Initialize instance variables immediately**
-        self.controller = None
-        self.backup_files = {} # Crucial: Initialize here
+        """Back up the original files once and render the sample CSVs once for the whole class.
+        Every test starts from and is reset to the sample snapshot (setUp/tearDown), so the
+        originals only need to come back in tearDownClass."""
+        cls.backup_files = {}
+        # Each data file must be in the snapshot, or a test's writes to it would reach the next test.
+        missing = set(CSV_FILES) - {filename for filename, _, _ in SAMPLE_CSVS}
+        if missing:
+            raise RuntimeError(f"No sample data for {sorted(missing)}")
 
         # Ensure backup directory exists
         if not os.path.exists(TEST_DATA_DIR):
-            try:
-                print(f"Creating backup directory: {TEST_DATA_DIR}")
-                os.makedirs(TEST_DATA_DIR)
-            except OSError as e:
-                if not os.path.isdir(TEST_DATA_DIR):
-                    print(f"ERROR: Failed to create backup directory {TEST_DATA_DIR}: {e}")
-                    raise
+            print(f"Creating backup directory: {TEST_DATA_DIR}")
+            os.makedirs(TEST_DATA_DIR)
+
+        # Restores whatever has been backed up, even if the loop below fails part-way.
+        cls.addClassCleanup(cls._restore_backups)
 
         # Backup loop
         print("Starting file backup loop...")
         for filename in CSV_FILES:
             print(f"Processing file: {filename}")
-            source_exists = os.path.exists(filename)
-            if not source_exists:
-                 print(f"Warning: Source file {filename} not found. Creating empty file.")
-                 try:
-                     # Create directory if it doesn't exist for the source file path
-                     os.makedirs(os.path.dirname(filename), exist_ok=True)
-                     with open(filename, 'w', newline='') as f:
-                         # Optionally write headers if needed by your repos
-                         # Example: writer = csv.writer(f); writer.writerow(get_headers_for(filename))
-                         pass
-                 except IOError as e:
-                     print(f"ERROR: Failed to create empty file {filename}: {e}")
-                     self.fail(f"Setup failed: Cannot create required empty file {filename}")
-
+            if not os.path.exists(filename):
+                print(f"Warning: Source file {filename} not found. Creating empty file.")
+                if os.path.dirname(filename):
+                    os.makedirs(os.path.dirname(filename), exist_ok=True)
+                open(filename, 'w', newline='').close()
             backup_path = os.path.join(TEST_DATA_DIR, os.path.basename(filename))
+            print(f"Attempting to copy {filename} to {backup_path}")
+            shutil.copy(filename, backup_path)
+            cls.backup_files[filename] = backup_path # Add only on success
+            print(f"Successfully backed up {filename}")
+        print(f"Finished file backup loop. backup_files created: {list(cls.backup_files)}")
+
+        # The snapshot every test starts from, as ready-to-write text.
+        cls.sample_csv_text = {filename: render_csv(headers, data) for filename, headers, data in SAMPLE_CSVS}
+
+        # Every setUp rewrites the same sample files, which gives them a new mtime, so main5's
+        # own load cache misses each time. For this class, parsed rows are also cached by file
+        # content: reading the bytes is enough to reuse the rows from an identical earlier load.
+        read_rows = main5.BaseRepository._read_rows
+        parsed_by_content = {}
+
+        def read_rows_by_content(repo):
+            with open(repo.csv_file, 'rb') as f:
+                key = (os.path.abspath(repo.csv_file), tuple(repo.required_headers), f.read())
+            rows = parsed_by_content.get(key)
+            if rows is None:
+                rows = parsed_by_content[key] = read_rows(repo)
+            return rows
+
+        main5.BaseRepository._read_rows = read_rows_by_content
+        cls.addClassCleanup(setattr, main5.BaseRepository, '_read_rows', read_rows)
+
+    @classmethod
+    def _restore_backups(cls):
+        """Restore original files from backup and remove the backups."""
+        print(f"Restoring files from backup_files: {list(cls.backup_files.keys())}")
+        for original_path, backup_path in cls.backup_files.items():
             try:
-                print(f"Attempting to copy {filename} to {backup_path}")
-                shutil.copy(filename, backup_path)
-                self.backup_files[filename] = backup_path # Add only on success
-                print(f"Successfully backed up {filename}")
+                if os.path.exists(backup_path):
+                    print(f"Restoring {original_path} from {backup_path}")
+                    shutil.copy(backup_path, original_path)
+                elif os.path.exists(original_path):
+                    print(f"Removing test-created file: {original_path}")
+                    os.remove(original_path)
+                else:
+                    print(f"Skipping restore for {original_path}: Neither backup nor original found.")
             except Exception as e:
-                 print(f"ERROR copying {filename} to {backup_path}: {e}")
-                 traceback.print_exc() # Print full traceback for copy error
-                 self.fail(f"Setup failed during backup of {filename}: {e}")
-        print(f"Finished file backup loop. backup_files created: {hasattr(self, 'backup_files')}")
+                print(f"WARNING: Error during file restoration/cleanup for {original_path}: {e}")
+                traceback.print_exc() # Show details of restore error
+
+        # Clean up backups regardless of restore success/failure
+        print("Cleaning up remaining backup files...")
+        for backup_path in cls.backup_files.values():
+             if os.path.exists(backup_path):
+                  try:
+                       print(f"Removing leftover backup: {backup_path}")
+                       os.remove(backup_path)
+                  except Exception as e:
+                       print(f"Warning: Failed to remove backup file {backup_path}: {e}")
+        cls.backup_files = {}
+
+        # Attempt to clean directory if empty
+        try:
+            if os.path.exists(TEST_DATA_DIR) and not os.listdir(TEST_DATA_DIR):
+                print(f"Removing empty backup directory: {TEST_DATA_DIR}")
+                os.rmdir(TEST_DATA_DIR)
+        except OSError as e:
+            # This might fail if files couldn't be removed above
+            print(f"Warning: Could not remove test data directory {TEST_DATA_DIR}: {e}")
+
+    def _write_sample_data(self):
+        """Overwrites every data file with the class's sample snapshot."""
+        for filename, text in self.sample_csv_text.items():
+            with open(filename, 'w', newline='') as f:
+                f.write(text)
+
+    def setUp(self):
+        """Reset the data files to the sample snapshot and start a fresh controller."""
+        print(f"\n--- Running setUp for test: {self.id()} ---") # Identify which test is running setup
+        # **Initialize instance variables immediately**
+        self.controller = None
 
         # Write sample data
         print("Writing sample CSV data...")
         try:
-            write_csv(APPLICANT_CSV, ['Name', 'NRIC', 'Age', 'Marital Status', 'Password'], SAMPLE_APPLICANTS)
-            write_csv(OFFICER_CSV, ['Name', 'NRIC', 'Age', 'Marital Status', 'Password'], SAMPLE_OFFICERS)
-            write_csv(MANAGER_CSV, ['Name', 'NRIC', 'Age', 'Marital Status', 'Password'], SAMPLE_MANAGERS)
-            write_csv(PROJECT_CSV, [
-                'Project Name', 'Neighborhood', 'Type 1', 'Number of units for Type 1',
-                'Selling price for Type 1', 'Type 2', 'Number of units for Type 2',
-                'Selling price for Type 2', 'Application opening date',
-                'Application closing date', 'Manager', 'Officer Slot', 'Officer', 'Visibility'
-            ], SAMPLE_PROJECTS)
-            write_csv(APPLICATION_CSV, ['ApplicantNRIC', 'ProjectName', 'FlatType', 'Status', 'RequestWithdrawal'], SAMPLE_APPLICATIONS)
-            write_csv(REGISTRATION_CSV, ['OfficerNRIC', 'ProjectName', 'Status'], SAMPLE_REGISTRATIONS)
-            write_csv(ENQUIRY_CSV, ['EnquiryID', 'ApplicantNRIC', 'ProjectName', 'Text', 'Reply'], SAMPLE_ENQUIRIES)
+            self._write_sample_data()
             print("Finished writing sample CSV data.")
         except Exception as e:
              print(f"ERROR writing sample CSV data: {e}")
@@ -224,51 +292,14 @@ class TestBTOMain(unittest.TestCase):
 
 
     def tearDown(self):
-        """Restore original files from backup."""
+        """Reset the data files to the sample snapshot, so nothing a test wrote outlives it."""
         print(f"\n--- Running tearDown for test: {self.id()} ---")
         self.controller = None # Release controller resources if any
-
-        # **Crucially check if backup_files exists before using**
-        if hasattr(self, 'backup_files') and self.backup_files is not None:
-            print(f"Restoring files from backup_files: {list(self.backup_files.keys())}")
-            for original_path, backup_path in self.backup_files.items():
-                try:
-                    if os.path.exists(backup_path):
-                        print(f"Restoring {original_path} from {backup_path}")
-                        shutil.copy(backup_path, original_path)
-                        # Check if backup removal is safe (e.g., not needed by parallel tests if applicable)
-                        # print(f"Removing backup {backup_path}")
-                        # os.remove(backup_path)
-                    elif os.path.exists(original_path):
-                        print(f"Removing test-created file: {original_path}")
-                        os.remove(original_path)
-                    else:
-                        print(f"Skipping restore for {original_path}: Neither backup nor original found.")
-                except Exception as e:
-                    print(f"WARNING: Error during file restoration/cleanup for {original_path}: {e}")
-                    traceback.print_exc() # Show details of restore error
-        else:
-            print("Warning: self.backup_files not found or is None in tearDown. Skipping restore loop.")
-
-        # Clean up backups regardless of restore success/failure if the dict exists
-        if hasattr(self, 'backup_files') and self.backup_files is not None:
-            print("Cleaning up remaining backup files...")
-            for backup_path in self.backup_files.values():
-                 if os.path.exists(backup_path):
-                      try:
-                           print(f"Removing leftover backup: {backup_path}")
-                           os.remove(backup_path)
-                      except Exception as e:
-                           print(f"Warning: Failed to remove backup file {backup_path}: {e}")
-
-        # Attempt to clean directory if empty
         try:
-            if os.path.exists(TEST_DATA_DIR) and not os.listdir(TEST_DATA_DIR):
-                print(f"Removing empty backup directory: {TEST_DATA_DIR}")
-                os.rmdir(TEST_DATA_DIR)
-        except OSError as e:
-            # This might fail if files couldn't be removed above
-            print(f"Warning: Could not remove test data directory {TEST_DATA_DIR}: {e}")
+            self._write_sample_data()
+        except Exception as e:
+            print(f"WARNING: Error resetting sample CSV data: {e}")
+            traceback.print_exc()
         print(f"--- Finished tearDown for test: {self.id()} ---")
 
 
@@ -1457,8 +1488,7 @@ class TestBTOMain(unittest.TestCase):
         # If APP4 had applied to PROJ2 *before* it closed, they *should* still see it.
         # Let's simulate that:
         app_past = Application(APP4_NRIC, PROJ2_NAME, 3, Application.STATUS_PENDING)
-        self.controller.app_repo._data_list.append(app_past) # Manually add past app
-        self.controller.app_repo.save_data()
+        self.controller.app_repo.add(app_past) # Manually add past app (saved on add)
         self.controller = ApplicationController() # Reload
         self._login_user(APP4_NRIC)
         current_app = self.controller.app_service.find_application_by_applicant(APP4_NRIC)